@@ -1,8 +1,10 @@
 """API router aggregator."""
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from app.api.routes import contact, csv
 
-api_router = APIRouter()
+# Serialize all API responses with orjson instead of the stdlib json encoder
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include all route modules
 api_router.include_router(contact.router)
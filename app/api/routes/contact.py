@@ -1,14 +1,19 @@
 """Contact scraping API routes."""
 
-from typing import Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, TypeVar, Union
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 
 from app.core.auth import verify_api_key
+from app.core.config import get_settings
 from app.schemas.contact import (
     ContactErrorResponse,
     ContactInfo,
+    ContactResult,
     HealthResponse,
     LinkedInErrorResponse,
     LinkedInOnlyResponse,
@@ -16,8 +21,34 @@ from app.schemas.contact import (
 from app.services.contact_service import scrape_website
 from app.services.linkedin_service import scrape_linkedin_only
 
+settings = get_settings()
 router = APIRouter()
 
+T = TypeVar("T")
+
+# Scrapes block for seconds on page fetches and OpenAI calls, so they run on
+# their own threads; the event loop stays free and short blocking calls made
+# by other routes (asyncio.to_thread) never queue behind a slow website
+_scrape_executor = ThreadPoolExecutor(
+    max_workers=settings.scrape_request_threads, thread_name_prefix="scrape"
+)
+
+
+async def _run_scrape(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking scrape function on the scrape thread pool.
+
+    Args:
+        func: Scrape function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_scrape_executor, partial(func, *args, **kwargs))
+
 
 @router.get("/", response_model=HealthResponse, tags=["Health"])
 def health_check():
@@ -29,11 +60,12 @@ def health_check():
 
 @router.get(
     "/scrap",
+    response_model=ContactResult,
     tags=["Scraping"],
     summary="Scrape website for contact information",
     description="Extract email addresses, phone numbers, and LinkedIn URLs from a website",
 )
-def scrape_contact(
+async def scrape_contact(
     website: str = Query(
         ...,
         description="Website URL to scrape for contact information",
@@ -69,7 +101,8 @@ def scrape_contact(
     Returns:
         ContactInfo with scraped data or ContactErrorResponse on failure
     """
-    result = scrape_website(
+    result = await _run_scrape(
+        scrape_website,
         website,
         validate_linkedin=validate_linkedin,
         skip_contact_page=skip_contact_page,
@@ -86,7 +119,7 @@ def scrape_contact(
     summary="Scrape website for LinkedIn URLs only (fast)",
     description="Extract only LinkedIn URLs from homepage (no AI, no contact page, no validation)",
 )
-def scrape_linkedin(
+async def scrape_linkedin(
     website: str = Query(
         ...,
         description="Website URL to scrape for LinkedIn URLs",
@@ -113,7 +146,7 @@ def scrape_linkedin(
     Returns:
         LinkedInOnlyResponse with company_linkedin and personal_linkedin arrays only
     """
-    result = scrape_linkedin_only(website)
+    result = await _run_scrape(scrape_linkedin_only, website)
 
     # Return plain response (FastAPI will handle serialization)
     return result
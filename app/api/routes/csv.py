@@ -1,18 +1,164 @@
 """CSV processing API routes."""
 
+import asyncio
+import tempfile
+from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.auth import verify_api_key
-from app.core.database import get_all_jobs, get_job_status
+from app.core.config import get_settings
+from app.core.database import get_all_jobs, get_job_counters, get_job_status_coalesced
 from app.schemas.csv import CSVUploadResponse, JobError, JobStatus
 from app.services.csv_service import start_csv_processing
 from app.services.linkedin_csv_service import start_linkedin_csv_processing
 from app.services.storage_service import get_public_url
 
+settings = get_settings()
 router = APIRouter()
 
+# Uploads are copied to disk in chunks of this size instead of read whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Paths of the upload routes, whose request bodies UploadSizeLimitMiddleware caps
+UPLOAD_PATH_PREFIX = "/csv/upload"
+
+
+def _upload_too_large() -> HTTPException:
+    """Build the error returned for uploads above the configured size limit."""
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum upload size is {settings.max_upload_size} bytes",
+    )
+
+
+class UploadSizeLimitMiddleware:
+    """
+    ASGI middleware enforcing settings.max_upload_size on the CSV upload routes.
+
+    FastAPI reads and spools the whole multipart body before a handler runs, so
+    the limit is applied here instead: a request declaring a larger
+    Content-Length is rejected before its body is read, and one that sends more
+    bytes than the limit is cut off as soon as it crosses it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(UPLOAD_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > settings.max_upload_size:
+            await self._reject(scope, receive, send)
+            return
+
+        received = 0
+        too_large = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, too_large
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > settings.max_upload_size:
+                    # Stop the upload as if the client had gone away
+                    too_large = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            # Whatever the app answers to the cut-off body is replaced by a 413
+            if not too_large:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not too_large:
+                raise
+        if too_large:
+            await self._reject(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the 413 response for an upload above the size limit."""
+        response = ORJSONResponse({"detail": _upload_too_large().detail}, status_code=413)
+        await response(scope, receive, send)
+
+
+async def _save_upload_to_tempfile(file: UploadFile) -> Path:
+    """
+    Stream an uploaded file to a temporary file on disk.
+
+    Args:
+        file: The uploaded file
+
+    Returns:
+        Path to the temporary file (the caller is responsible for deleting it)
+
+    Raises:
+        HTTPException: 413 if the file exceeds settings.max_upload_size (a
+            backstop; UploadSizeLimitMiddleware normally rejects it first)
+    """
+    size = 0
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.max_upload_size:
+                break
+            tmp.write(chunk)
+
+    if size > settings.max_upload_size:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise _upload_too_large()
+    return Path(tmp.name)
+
+
+def _job_status_response(job_data: dict) -> JobStatus:
+    """
+    Build the API representation of a job row.
+
+    Args:
+        job_data: Job row as returned by the database layer
+
+    Returns:
+        JobStatus with progress percentage and download URL filled in
+    """
+    job_id = job_data["id"]
+    job_status = job_data["status"]
+    total = job_data.get("total_rows", 0)
+    processed = job_data.get("processed_rows", 0)
+
+    return JobStatus(
+        job_id=str(job_id),  # Convert integer ID to string for response
+        status=job_status,
+        total_rows=total,
+        processed_rows=processed,
+        failed_rows=job_data.get("failed_rows", 0),
+        # Integer math, truncated to 2 decimals
+        progress_percentage=(processed * 10000 // total) / 100.0 if total else 0.0,
+        created_at=job_data.get("created_at"),
+        completed_at=job_data.get("completed_at"),
+        error=job_data.get("error"),
+        # Add download URL if completed
+        download_url=f"/csv/download/{job_id}" if job_status == "completed" else None,
+    )
+
 
 @router.post(
     "/upload-csv",
@@ -43,22 +189,27 @@ async def upload_csv(
     Returns:
         CSVUploadResponse with job_id for tracking
     """
-    # Validate file type
+    # Validate file type (the size limit is enforced by UploadSizeLimitMiddleware)
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="File must be a CSV file")
 
-    try:
-        # Read file content
-        content = await file.read()
+    # Stream file content to disk instead of holding it in memory
+    csv_path = await _save_upload_to_tempfile(file)
 
+    try:
         # Start background processing with worker pool (returns integer job ID)
-        job_id = start_csv_processing(content, file.filename, website_column)
+        try:
+            job_id = await asyncio.to_thread(
+                start_csv_processing, csv_path, file.filename, website_column
+            )
+        finally:
+            csv_path.unlink(missing_ok=True)
 
         if not job_id:
             raise HTTPException(status_code=500, detail="Failed to create job")
 
         # Get initial job status to get total rows
-        job_data = get_job_status(job_id)
+        job_data = await asyncio.to_thread(get_job_counters, job_id)
         total_rows = job_data.get("total_rows", 0) if job_data else 0
 
         return CSVUploadResponse(
@@ -112,22 +263,27 @@ async def upload_linkedin_csv(
     Returns:
         CSVUploadResponse with job_id for tracking
     """
-    # Validate file type
+    # Validate file type (the size limit is enforced by UploadSizeLimitMiddleware)
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="File must be a CSV file")
 
-    try:
-        # Read file content
-        content = await file.read()
+    # Stream file content to disk instead of holding it in memory
+    csv_path = await _save_upload_to_tempfile(file)
 
+    try:
         # Start background processing with worker pool (returns integer job ID)
-        job_id = start_linkedin_csv_processing(content, file.filename, website_column)
+        try:
+            job_id = await asyncio.to_thread(
+                start_linkedin_csv_processing, csv_path, file.filename, website_column
+            )
+        finally:
+            csv_path.unlink(missing_ok=True)
 
         if not job_id:
             raise HTTPException(status_code=500, detail="Failed to create job")
 
         # Get initial job status to get total rows
-        job_data = get_job_status(job_id)
+        job_data = await asyncio.to_thread(get_job_counters, job_id)
         total_rows = job_data.get("total_rows", 0) if job_data else 0
 
         return CSVUploadResponse(
@@ -159,33 +315,12 @@ async def get_job(job_id: int, api_key: str = Depends(verify_api_key)):
     Returns:
         JobStatus with progress and completion information
     """
-    job_data = get_job_status(job_id)
+    job_data = await get_job_status_coalesced(job_id)
 
     if not job_data:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Calculate progress percentage
-    total = job_data.get("total_rows", 0)
-    processed = job_data.get("processed_rows", 0)
-    progress = (processed / total * 100) if total > 0 else 0
-
-    # Add download URL if completed
-    download_url = None
-    if job_data.get("status") == "completed":
-        download_url = f"/csv/download/{job_id}"
-
-    return JobStatus(
-        job_id=str(job_data["id"]),  # Convert integer ID to string for response
-        status=job_data["status"],
-        total_rows=total,
-        processed_rows=processed,
-        failed_rows=job_data.get("failed_rows", 0),
-        progress_percentage=round(progress, 2),
-        created_at=job_data.get("created_at"),
-        completed_at=job_data.get("completed_at"),
-        error=job_data.get("error"),
-        download_url=download_url,
-    )
+    return _job_status_response(job_data)
 
 
 @router.get(
@@ -206,7 +341,7 @@ async def download_csv(job_id: int, api_key: str = Depends(verify_api_key)):
         JSON with signed URL that expires in 1 hour
     """
     # Check if job exists and is completed
-    job_data = get_job_status(job_id)
+    job_data = await get_job_status_coalesced(job_id)
 
     if not job_data:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -225,7 +360,7 @@ async def download_csv(job_id: int, api_key: str = Depends(verify_api_key)):
         )
 
     # Get signed URL from Supabase storage
-    signed_url = get_public_url(output_path)
+    signed_url = await asyncio.to_thread(get_public_url, output_path)
 
     if not signed_url:
         raise HTTPException(status_code=500, detail="Failed to generate download URL")
@@ -265,33 +400,7 @@ async def get_jobs_list(
     Returns:
         List of JobStatus objects
     """
-    jobs = get_all_jobs(status, limit)
+    jobs = await asyncio.to_thread(get_all_jobs, status, limit)
 
     # Convert to JobStatus format
-    result = []
-    for job_data in jobs:
-        total = job_data.get("total_rows", 0)
-        processed = job_data.get("processed_rows", 0)
-        progress = (processed / total * 100) if total > 0 else 0
-
-        job_id = job_data["id"]  # Get integer ID
-        download_url = None
-        if job_data.get("status") == "completed":
-            download_url = f"/csv/download/{job_id}"
-
-        result.append(
-            JobStatus(
-                job_id=str(job_id),  # Convert to string for API response
-                status=job_data["status"],
-                total_rows=total,
-                processed_rows=processed,
-                failed_rows=job_data.get("failed_rows", 0),
-                progress_percentage=round(progress, 2),
-                created_at=job_data.get("created_at"),
-                completed_at=job_data.get("completed_at"),
-                error=job_data.get("error"),
-                download_url=download_url,
-            )
-        )
-
-    return result
+    return [_job_status_response(job_data) for job_data in jobs]
@@ -1,16 +1,32 @@
 """Authentication and authorization utilities."""
+import hmac
+
 from fastapi import Security, HTTPException, status
 from fastapi.security import APIKeyHeader
-from app.core.config import get_settings
+from app.core.config import get_auth_settings
 
 
-settings = get_settings()
+auth_settings = get_auth_settings()
 
 # Define API Key header
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
-async def verify_api_key(api_key: str = Security(api_key_header)) -> str:
+def _is_valid_api_key(api_key: str) -> bool:
+    """
+    Check an API key against all configured keys in constant time.
+
+    Every configured key is compared so the response time does not reveal
+    how much of a key matched or which key was tried.
+    """
+    candidate = api_key.encode()
+    matched = False
+    for valid_key in auth_settings.valid_keys:
+        matched |= hmac.compare_digest(candidate, valid_key.encode())
+    return matched
+
+
+def verify_api_key(api_key: str = Security(api_key_header)) -> str:
     """
     Verify the API key from the request header.
     
@@ -23,10 +39,8 @@ async def verify_api_key(api_key: str = Security(api_key_header)) -> str:
     Raises:
         HTTPException: If API key is missing or invalid
     """
-    valid_api_keys = settings.get_valid_api_keys()
-    
     # If no API keys are configured, allow all requests (for development)
-    if not valid_api_keys:
+    if auth_settings.disabled:
         return "development"
     
     if not api_key:
@@ -36,7 +50,7 @@ async def verify_api_key(api_key: str = Security(api_key_header)) -> str:
             headers={"WWW-Authenticate": "ApiKey"},
         )
     
-    if api_key not in valid_api_keys:
+    if not _is_valid_api_key(api_key):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API Key. Access denied.",
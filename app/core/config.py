@@ -1,7 +1,8 @@
 """Configuration settings for the application."""
 
 import os
-from functools import lru_cache
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 from pydantic_settings import BaseSettings
 
@@ -13,12 +14,14 @@ class Settings(BaseSettings):
     app_name: str = "Contact Scraper API"
     debug: bool = False
     api_keys: str = ""  # Comma-separated list of valid API keys
+    log_level: str = "INFO"  # DEBUG also logs per-row and per-website details
 
     # Redis Settings
     redis_host: str = "localhost"
     redis_port: int = 6379
     redis_db: int = 0
     redis_password: str = ""  # Optional Redis password
+    redis_max_connections: int = 50  # Shared Redis connection pool size
     cache_ttl: int = 86400  # Cache TTL in seconds (default: 24 hours)
 
     # OpenAI Settings
@@ -26,28 +29,65 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-4.1-mini"
     openai_timeout: int = 20  # OpenAI API timeout in seconds
     request_timeout: int = 10  # HTTP request timeout for fetching pages
+    ai_validation_batch_size: int = 20  # Websites per batched OpenAI call (validation, contact page) in CSV jobs
+    ai_validation_batch_wait: float = 1.0  # Max seconds to wait for a batch to fill
 
     # Supabase Settings
     supabase_url: str = ""
     supabase_key: str = ""
     supabase_bucket: str = "contact-scraper"
+    supabase_timeout: int = 30  # Supabase API timeout in seconds
 
     # Worker Pool Settings
     max_workers: int = 2  # Maximum concurrent jobs
     csv_concurrent_workers: int = 10  # Concurrent requests within each CSV job
+    scrape_request_threads: int = 40  # Concurrent /scrap and /scrap-linkedin requests
+    csv_chunk_size: int = 10_000  # Rows read and processed at a time in CSV jobs
+    max_upload_size: int = 100 * 1024 * 1024  # Maximum CSV upload size in bytes
 
     class Config:
         env_file = ".env"
         case_sensitive = False
 
-    def get_valid_api_keys(self) -> set[str]:
-        """Parse and return set of valid API keys."""
-        if not self.api_keys:
-            return set()
-        return {key.strip() for key in self.api_keys.split(",") if key.strip()}
+    @property
+    def empty_result_cache_ttl(self) -> int:
+        """TTL for cached "no contacts found" results, so those sites are re-checked sooner."""
+        return self.cache_ttl // 10
+
+    @property
+    def http_pool_size(self) -> int:
+        """Outgoing connections needed when CSV jobs and /scrap requests all run at full concurrency."""
+        return self.max_workers * self.csv_concurrent_workers + self.scrape_request_threads
+
+    @cached_property
+    def valid_api_keys(self) -> frozenset[str]:
+        """Parse the configured API keys once and cache them on the instance."""
+        return frozenset(key.strip() for key in self.api_keys.split(",") if key.strip())
+
+    @cached_property
+    def auth_disabled(self) -> bool:
+        """Authentication is disabled when no API keys are configured."""
+        return not self.valid_api_keys
 
 
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+@dataclass(frozen=True, slots=True)
+class AuthSettings:
+    """Minimal, immutable view of the settings read on every authenticated request."""
+
+    valid_keys: frozenset[str]
+    disabled: bool
+
+
+@lru_cache()
+def get_auth_settings() -> AuthSettings:
+    """Get cached authentication settings derived from the main settings."""
+    settings = get_settings()
+    return AuthSettings(
+        valid_keys=settings.valid_api_keys, disabled=settings.auth_disabled
+    )
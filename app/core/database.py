@@ -1,25 +1,53 @@
 """Database operations: Redis for caching, Supabase for job tracking."""
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
+import httpx
 import redis
-import json
+import asyncio
+import logging
+import orjson
+import threading
+import time
 from typing import Optional
 from datetime import datetime
+from urllib.parse import urlparse
 from app.core.config import get_settings
 
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Create Redis client for caching
-redis_client = redis.Redis(
+# Create Redis client for caching, backed by a pool shared across threads
+# (blocks until a connection frees up instead of failing when exhausted)
+redis_pool = redis.BlockingConnectionPool(
     host=settings.redis_host,
     port=settings.redis_port,
     db=settings.redis_db,
     password=settings.redis_password if settings.redis_password else None,
-    decode_responses=True  # Automatically decode responses to strings
+    max_connections=settings.redis_max_connections,
 )
+redis_client = redis.Redis(connection_pool=redis_pool)
 
-# Create Supabase client for job tracking
-supabase: Client = create_client(settings.supabase_url, settings.supabase_key)
+# Create Supabase client for job tracking. All PostgREST, storage and auth calls
+# share one keep-alive HTTP/2 connection pool sized for the CSV workers, and the
+# client's default schema is "scraping" (supabase.schema() would build a new
+# PostgREST client that ignores this pool).
+supabase_http_client = httpx.Client(
+    http2=True,
+    follow_redirects=True,
+    timeout=settings.supabase_timeout,
+    limits=httpx.Limits(
+        max_connections=settings.http_pool_size,
+        max_keepalive_connections=settings.http_pool_size,
+    ),
+)
+supabase: Client = create_client(
+    settings.supabase_url,
+    settings.supabase_key,
+    options=ClientOptions(schema="scraping", httpx_client=supabase_http_client),
+)
+
+# Build the jobs table builder once and reuse it for every query
+_JOBS_TABLE = supabase.table("contact_scraper_jobs")
 
 
 def ensure_tables_exist():
@@ -30,15 +58,87 @@ def ensure_tables_exist():
     try:
         # Check if contact_scraper_jobs table exists in scraping schema
         # If not, run the SQL script in supabase_schema.sql
-        print("[Supabase] Database tables ready in 'scraping' schema")
+        logger.info("[Supabase] Database tables ready in 'scraping' schema")
     except Exception as e:
-        print(f"[!] Error ensuring tables exist: {e}")
+        logger.error("Error ensuring tables exist: %s", e)
 
 
 # ============================================================================
 # Contact Cache Operations (Redis)
 # ============================================================================
 
+# Hosts whose paths belong to different owners (profiles, pages, link lists):
+# one path's contacts say nothing about another's, so they get no domain entry
+_SHARED_HOSTS = frozenset({
+    "facebook.com",
+    "m.facebook.com",
+    "instagram.com",
+    "linkedin.com",
+    "twitter.com",
+    "x.com",
+    "youtube.com",
+    "tiktok.com",
+    "linktr.ee",
+    "sites.google.com",
+    "google.com",
+    "medium.com",
+    "github.com",
+})
+
+
+def _domain_cache_key(website: str) -> Optional[str]:
+    """
+    Build the domain cache key of a website, if its host can have one.
+    
+    The domain entry holds the contacts found on a site's homepage and serves
+    other pages of the site (e.g. x.com/about after x.com) from the cache.
+    
+    Args:
+        website: The normalized website URL
+        
+    Returns:
+        The domain key, or None for multi-tenant hosts
+    """
+    netloc = urlparse(website).netloc
+    if netloc in _SHARED_HOSTS:
+        return None
+    return f"contact:domain:{netloc}"
+
+
+def _is_root_url(website: str) -> bool:
+    """Whether a normalized URL is a site's homepage (normalization drops "/")."""
+    return not urlparse(website).path
+
+
+def _contact_lookup_keys(website: str) -> list[str]:
+    """
+    Build the cache keys read for a website, in order of preference.
+    
+    Args:
+        website: The normalized website URL
+        
+    Returns:
+        The exact URL key, followed by the domain key for pages below the root
+    """
+    keys = [f"contact:{website}"]
+    if not _is_root_url(website):
+        domain_key = _domain_cache_key(website)
+        if domain_key:
+            keys.append(domain_key)
+    return keys
+
+
+def _contact_from_cache_entry(website: str, exact, by_domain=None) -> Optional[dict]:
+    """Decode a cached contact, preferring the exact URL entry over the domain one."""
+    if exact:
+        return orjson.loads(exact)
+    if by_domain:
+        contact = orjson.loads(by_domain)
+        contact["website"] = website
+        return contact
+    return None
+
+
 def get_contact_from_cache(website: str) -> Optional[dict]:
     """
     Retrieve existing contact info for a website from Redis cache.
@@ -47,18 +147,57 @@ def get_contact_from_cache(website: str) -> Optional[dict]:
         website: The normalized website URL
         
     Returns:
-        Contact information dict if found, None otherwise
+        Contact information dict if found (by URL, else by domain), None otherwise
     """
     try:
-        data = redis_client.get(f"contact:{website}")
-        if data:
-            return json.loads(data)
-        return None
+        return _contact_from_cache_entry(
+            website, *redis_client.mget(_contact_lookup_keys(website))
+        )
     except Exception as e:
-        print(f"[!] Error retrieving from Redis: {e}")
+        logger.error("Error retrieving from Redis: %s", e)
         return None
 
 
+# Maximum number of websites looked up by a single MGET
+CACHE_MGET_CHUNK_SIZE = 1000
+
+
+def get_contacts_from_cache_batch(websites: list[str]) -> dict[str, dict]:
+    """
+    Retrieve cached contact info for many websites in one Redis round-trip.
+    
+    Args:
+        websites: List of normalized website URLs
+        
+    Returns:
+        Dict mapping each cached website to its contact information
+        (websites without a cache entry are omitted)
+    """
+    if not websites:
+        return {}
+    try:
+        # One MGET per chunk of websites, all sent in a single pipelined round-trip
+        keys = [_contact_lookup_keys(website) for website in websites]
+        pipe = redis_client.pipeline(transaction=False)
+        for start in range(0, len(websites), CACHE_MGET_CHUNK_SIZE):
+            chunk = keys[start:start + CACHE_MGET_CHUNK_SIZE]
+            pipe.mget([key for website_keys in chunk for key in website_keys])
+        results = iter(
+            [data for chunk_results in pipe.execute() for data in chunk_results]
+        )
+        contacts = {}
+        for website, website_keys in zip(websites, keys):
+            # Each website's values come back in the order its keys were sent
+            entries = [next(results) for _ in website_keys]
+            contact = _contact_from_cache_entry(website, *entries)
+            if contact:
+                contacts[website] = contact
+        return contacts
+    except Exception as e:
+        logger.error("Error retrieving batch from Redis: %s", e)
+        return {}
+
+
 def save_contact_to_cache(
     website: str, 
     emails: list[str], 
@@ -66,10 +205,13 @@ def save_contact_to_cache(
     linkedin_urls: dict[str, list[str]] = None
 ) -> None:
     """
-    Save contact info to Redis cache with TTL.
+    Save contact info to Redis cache with TTL, under the URL and its domain.
+    
+    Only a homepage that has contacts is saved under its domain, so a
+    subpage or an empty result never stands in for the rest of the site.
     
     Args:
-        website: Website URL (used as key)
+        website: Normalized website URL (used as key)
         emails: List of email addresses
         phones: List of phone numbers
         linkedin_urls: Dictionary with 'company' and 'personal' LinkedIn URLs
@@ -80,33 +222,43 @@ def save_contact_to_cache(
         "phones": phones if phones else [],
         "linkedin_urls": linkedin_urls if linkedin_urls else {"company": [], "personal": []},
     }
+    # Sites with no contacts are re-scraped sooner in case they add some
+    has_contacts = emails or phones or any(doc["linkedin_urls"].values())
+    ttl = settings.cache_ttl if has_contacts else settings.empty_result_cache_ttl
     try:
-        # Use setex to set value with TTL from config
-        redis_client.setex(
-            f"contact:{website}",
-            settings.cache_ttl,  # TTL in seconds from config
-            json.dumps(doc)
-        )
-        print(f"[Redis] Saved contact info for {website} (TTL: {settings.cache_ttl}s)")
+        # NX: the first result cached for a key wins until it expires, so
+        # concurrent scrapes of the same site don't rewrite it
+        data = orjson.dumps(doc)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.set(f"contact:{website}", data, ex=ttl, nx=True)
+        domain_key = _domain_cache_key(website)
+        if has_contacts and domain_key and _is_root_url(website):
+            pipe.set(domain_key, data, ex=ttl, nx=True)
+        pipe.execute()
+        logger.debug("[Redis] Saved contact info for %s (TTL: %ss)", website, ttl)
     except Exception as e:
-        print(f"[!] Error saving to Redis: {e}")
+        logger.error("Error saving to Redis: %s", e)
 
 
 def clear_cache(website: str) -> bool:
     """
-    Clear cached contact info for a specific website.
+    Clear cached contact info for a specific website and its domain.
     
     Args:
-        website: The website URL to clear from cache
+        website: The normalized website URL to clear from cache
         
     Returns:
         True if deleted, False otherwise
     """
     try:
-        result = redis_client.delete(f"contact:{website}")
+        keys = [f"contact:{website}"]
+        domain_key = _domain_cache_key(website)
+        if domain_key:
+            keys.append(domain_key)
+        result = redis_client.delete(*keys)
         return result > 0
     except Exception as e:
-        print(f"[!] Error clearing cache: {e}")
+        logger.error("Error clearing cache: %s", e)
         return False
 
 
@@ -114,6 +266,19 @@ def clear_cache(website: str) -> bool:
 # Job Tracking Operations (Supabase - scraping schema)
 # ============================================================================
 
+# Short-lived cache for job listings so polling clients share one query
+JOBS_LIST_CACHE_TTL = 2  # seconds
+JOBS_LIST_CACHE_MAX_SIZE = 32
+_jobs_list_cache: dict[tuple[Optional[str], int], tuple[float, list[dict]]] = {}
+_jobs_list_cache_lock = threading.Lock()
+
+
+def invalidate_jobs_list_cache() -> None:
+    """Drop all cached job listings (called on job state transitions)."""
+    with _jobs_list_cache_lock:
+        _jobs_list_cache.clear()
+
+
 def create_job(
     total_rows: int,
     input_path: str,
@@ -144,15 +309,72 @@ def create_job(
             "original_filename": original_filename
         }
         
-        response = supabase.schema("scraping").table("contact_scraper_jobs").insert(job_data).execute()
+        response = _JOBS_TABLE.insert(job_data).execute()
         job_id = response.data[0]["id"] if response.data else None
-        print(f"[Supabase] Created job {job_id}")
+        invalidate_jobs_list_cache()
+        logger.info("[Supabase] Created job %s", job_id)
         return job_id
     except Exception as e:
-        print(f"[!] Error creating job: {e}")
+        logger.error("Error creating job: %s", e)
         return None
 
 
+# Columns served by the job status endpoints (output_path is used by downloads)
+JOB_STATUS_COLUMNS = (
+    "id,status,total_rows,processed_rows,failed_rows,created_at,completed_at,error,output_path"
+)
+JOB_COUNTER_COLUMNS = "processed_rows,failed_rows,total_rows,status"
+
+
+def _with_live_progress(job_id: int, job_data: dict) -> dict:
+    """Overlay the live Redis counters of a running job onto its stored row."""
+    # Running jobs persist their counters periodically; show the live ones
+    if job_data["status"] in ACTIVE_JOB_STATUSES:
+        for field, value in get_live_job_progress(job_id).items():
+            job_data[field] = max(job_data[field], value)
+    return job_data
+
+
+def _with_live_progress_many(jobs: list[dict]) -> list[dict]:
+    """
+    Overlay live Redis counters onto a list of stored job rows.
+    
+    The counters of all running jobs are read in one pipelined round-trip.
+    Rows are copied before being changed, since the list may be cached.
+    
+    Args:
+        jobs: Job rows as stored in Supabase
+        
+    Returns:
+        The job rows, with live counters for running jobs
+    """
+    active = [job for job in jobs if job["status"] in ACTIVE_JOB_STATUSES]
+    if not active:
+        return jobs
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for job in active:
+            pipe.hgetall(_job_progress_key(job["id"]))
+        live = {
+            job["id"]: _parse_job_progress(progress)
+            for job, progress in zip(active, pipe.execute())
+        }
+    except Exception as e:
+        logger.error("Error retrieving live job progress: %s", e)
+        return jobs
+    
+    result = []
+    for job in jobs:
+        progress = live.get(job["id"])
+        if progress:
+            job = {
+                **job,
+                **{field: max(job[field], value) for field, value in progress.items()},
+            }
+        result.append(job)
+    return result
+
+
 def get_job_status(job_id: int) -> Optional[dict]:
     """
     Get the status of a background job from Supabase.
@@ -164,20 +386,72 @@ def get_job_status(job_id: int) -> Optional[dict]:
         Job status dict if found, None otherwise
     """
     try:
-        response = supabase.schema("scraping").table("contact_scraper_jobs").select("*").eq("id", job_id).execute()
+        response = _JOBS_TABLE.select(JOB_STATUS_COLUMNS).eq("id", job_id).execute()
         
         if response.data and len(response.data) > 0:
-            return response.data[0]
+            return _with_live_progress(job_id, response.data[0])
+        return None
+    except Exception as e:
+        logger.error("Error retrieving job status: %s", e)
+        return None
+
+
+def get_job_counters(job_id: int) -> Optional[dict]:
+    """
+    Get only the progress counters and status of a job.
+    
+    Args:
+        job_id: Unique job identifier (integer primary key)
+        
+    Returns:
+        Dict with processed_rows, failed_rows, total_rows and status if found,
+        None otherwise
+    """
+    try:
+        response = _JOBS_TABLE.select(JOB_COUNTER_COLUMNS).eq("id", job_id).execute()
+        
+        if response.data:
+            return _with_live_progress(job_id, response.data[0])
         return None
     except Exception as e:
-        print(f"[!] Error retrieving job status: {e}")
+        logger.error("Error retrieving job counters: %s", e)
         return None
 
 
+# In-flight status lookups, shared by concurrent requests for the same job
+_job_status_inflight: dict[int, asyncio.Task] = {}
+
+
+async def get_job_status_coalesced(job_id: int) -> Optional[dict]:
+    """
+    Get the status of a job, sharing one Supabase query between concurrent callers.
+    
+    The first caller for a job ID runs get_job_status in a worker thread;
+    callers arriving while that query is in flight await the same result.
+    
+    Args:
+        job_id: Unique job identifier (integer primary key)
+        
+    Returns:
+        Job status dict if found, None otherwise
+    """
+    task = _job_status_inflight.get(job_id)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(get_job_status, job_id))
+        _job_status_inflight[job_id] = task
+        task.add_done_callback(lambda _: _job_status_inflight.pop(job_id, None))
+    
+    # Shield so one cancelled request does not cancel the query for the others
+    return await asyncio.shield(task)
+
+
 def get_all_jobs(status: Optional[str] = None, limit: int = 50) -> list[dict]:
     """
     Get all jobs with optional status filter.
     
+    Results are cached for JOBS_LIST_CACHE_TTL seconds per (status, limit);
+    running jobs show their live counters, as in get_job_status.
+    
     Args:
         status: Optional status filter (queued, processing, completed, failed)
         limit: Maximum number of jobs to return
@@ -185,8 +459,20 @@ def get_all_jobs(status: Optional[str] = None, limit: int = 50) -> list[dict]:
     Returns:
         List of job dicts
     """
+    cache_key = (status, limit)
+    with _jobs_list_cache_lock:
+        cached = _jobs_list_cache.get(cache_key)
+        cached_jobs = (
+            cached[1]
+            if cached and time.monotonic() - cached[0] < JOBS_LIST_CACHE_TTL
+            else None
+        )
+    # Running jobs' counters are overlaid on every call, cached list or not
+    if cached_jobs is not None:
+        return _with_live_progress_many(cached_jobs)
+    
     try:
-        query = supabase.schema("scraping").table("contact_scraper_jobs").select("*")
+        query = _JOBS_TABLE.select(JOB_STATUS_COLUMNS)
         
         # Filter by status if provided
         if status:
@@ -196,12 +482,25 @@ def get_all_jobs(status: Optional[str] = None, limit: int = 50) -> list[dict]:
         query = query.order("created_at", desc=True).limit(limit)
         
         response = query.execute()
-        return response.data if response.data else []
+        jobs = response.data if response.data else []
+        
+        with _jobs_list_cache_lock:
+            if len(_jobs_list_cache) >= JOBS_LIST_CACHE_MAX_SIZE:
+                _jobs_list_cache.clear()
+            _jobs_list_cache[cache_key] = (time.monotonic(), jobs)
+        return _with_live_progress_many(jobs)
     except Exception as e:
-        print(f"[!] Error retrieving jobs: {e}")
+        logger.error("Error retrieving jobs: %s", e)
         return []
 
 
+# Statuses of jobs that are still running; a finished job's status never changes
+ACTIVE_JOB_STATUSES = ("queued", "processing")
+
+# Attempts made by update_job_status when concurrent status writes keep bumping lock_version
+JOB_UPDATE_MAX_ATTEMPTS = 3
+
+
 def update_job_status(
     job_id: int,
     status: Optional[str] = None,
@@ -210,7 +509,7 @@ def update_job_status(
     error: Optional[str] = None,
     output_path: Optional[str] = None,
     input_path: Optional[str] = None
-) -> None:
+) -> bool:
     """
     Update a job's status in Supabase.
     
@@ -222,6 +521,10 @@ def update_job_status(
         error: Error message if any
         output_path: Storage path to output CSV
         input_path: Storage path to input CSV
+        
+    Returns:
+        True if the update was written (or there was nothing to write), False if
+        the job was not found, the update was refused or it could not be written
     """
     try:
         update_data = {}
@@ -246,42 +549,247 @@ def update_job_status(
         if input_path:
             update_data["input_path"] = input_path
         
-        if update_data:
-            supabase.schema("scraping").table("contact_scraper_jobs").update(update_data).eq("id", job_id).execute()
-            print(f"[Supabase] Updated job {job_id}: {update_data}")
+        if not update_data:
+            return True
+        
+        # Optimistic locking: only write if nobody else changed the row since we
+        # read it, and re-read and retry otherwise
+        for _ in range(JOB_UPDATE_MAX_ATTEMPTS):
+            response = _JOBS_TABLE.select("status, lock_version").eq("id", job_id).execute()
+            if not response.data:
+                logger.warning("Job %s not found, skipping update", job_id)
+                return False
+            current = response.data[0]
+            
+            # Never change the status of a finished job (late straggler writes,
+            # e.g. a job marked failed at shutdown that its worker then completes)
+            if status and current["status"] not in ACTIVE_JOB_STATUSES:
+                logger.warning(
+                    "[Supabase] Job %s is already %s, not setting it to %s",
+                    job_id,
+                    current["status"],
+                    status,
+                )
+                return False
+            
+            lock_version = current["lock_version"]
+            response = (
+                _JOBS_TABLE.update({**update_data, "lock_version": lock_version + 1})
+                .eq("id", job_id)
+                .eq("lock_version", lock_version)
+                .execute()
+            )
+            if response.data:
+                logger.debug("[Supabase] Updated job %s: %s", job_id, update_data)
+                if status:
+                    invalidate_jobs_list_cache()
+                return True
+        
+        logger.error(
+            "Error updating job status: job %s kept changing, gave up after %s attempts",
+            job_id,
+            JOB_UPDATE_MAX_ATTEMPTS,
+        )
     except Exception as e:
-        print(f"[!] Error updating job status: {e}")
+        logger.error("Error updating job status: %s", e)
+    return False
+
 
+# Live progress of running jobs (Redis hash + pub/sub channel per job)
+JOB_PROGRESS_TTL = 3600  # seconds
+JOB_PROGRESS_FIELDS = ("processed_rows", "failed_rows")
 
-def increment_job_progress(job_id: int, failed: bool = False) -> None:
+
+def _job_progress_key(job_id: int) -> str:
+    """Redis key (and pub/sub channel) holding a job's live progress."""
+    return f"job:{job_id}:progress"
+
+
+def publish_job_progress(job_id: int, processed_rows: int, failed_rows: int) -> None:
     """
-    Increment the progress counters for a job.
+    Store a running job's latest counters in Redis and announce them.
+    
+    The counters are kept in the job:{id}:progress hash (read by get_job_status)
+    and published on the channel of the same name, in a single round-trip.
     
     Args:
         job_id: Unique job identifier (integer primary key)
-        failed: Whether this row failed processing
+        processed_rows: Rows processed so far
+        failed_rows: Rows failed so far
     """
+    key = _job_progress_key(job_id)
+    progress = {"processed_rows": processed_rows, "failed_rows": failed_rows}
     try:
-        job_data = get_job_status(job_id)
-        if not job_data:
-            return
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping=progress)
+        pipe.expire(key, JOB_PROGRESS_TTL)
+        pipe.publish(key, orjson.dumps(progress))
+        pipe.execute()
+    except Exception as e:
+        logger.error("Error publishing job progress: %s", e)
+
+
+def get_live_job_progress(job_id: int) -> dict[str, int]:
+    """
+    Get the latest published counters of a running job.
+    
+    Args:
+        job_id: Unique job identifier (integer primary key)
         
-        processed_rows = job_data["processed_rows"] + 1
-        failed_rows = job_data["failed_rows"] + (1 if failed else 0)
+    Returns:
+        Dict with processed_rows and failed_rows, or an empty dict if none were published
+    """
+    try:
+        return _parse_job_progress(redis_client.hgetall(_job_progress_key(job_id)))
+    except Exception as e:
+        logger.error("Error retrieving live job progress: %s", e)
+        return {}
+
+
+def _parse_job_progress(progress: dict) -> dict[str, int]:
+    """Decode a job:{id}:progress hash as returned by HGETALL."""
+    return {
+        field: int(progress[field.encode()])
+        for field in JOB_PROGRESS_FIELDS
+        if field.encode() in progress
+    }
+
+
+def clear_job_progress(job_id: int) -> None:
+    """Remove a job's live counters once the durable record is up to date."""
+    try:
+        redis_client.delete(_job_progress_key(job_id))
+    except Exception as e:
+        logger.error("Error clearing live job progress: %s", e)
+
+
+def bulk_increment_job_progress(job_id: int, processed_delta: int, failed_delta: int = 0) -> bool:
+    """
+    Add batched deltas to the progress counters for a job in one round-trip.
+    
+    Args:
+        job_id: Unique job identifier (integer primary key)
+        processed_delta: Number of rows processed since the last flush
+        failed_delta: Number of those rows that failed
         
-        update_data = {
-            "processed_rows": processed_rows,
-            "failed_rows": failed_rows
-        }
+    Returns:
+        True if the counters were updated (or there was nothing to add), False otherwise
+    """
+    if processed_delta <= 0 and failed_delta <= 0:
+        return True
+    
+    try:
+        supabase.rpc(
+            "bulk_increment_job_progress",
+            {"job_id": job_id, "processed_delta": processed_delta, "failed_delta": failed_delta}
+        ).execute()
+        return True
+    except Exception as e:
+        logger.error("Error bulk incrementing job progress: %s", e)
+        return False
+
+
+# Attempts made to persist a job's final counters when its processing ends
+JOB_PROGRESS_PERSIST_ATTEMPTS = 3
+
+
+class JobProgressAggregator:
+    """
+    Accumulate per-row progress in memory and publish it in batches.
+    
+    Every ``flush_rows`` rows, or ``flush_interval`` seconds after the first
+    unflushed row, the running totals are published to Redis (see
+    publish_job_progress), which is what the status API shows while the job
+    runs. The durable Supabase counters are only advanced through
+    bulk_increment_job_progress every ``persist_interval`` seconds and when
+    processing ends. Use as a context manager so the final counts are persisted.
+    """
+    
+    def __init__(
+        self,
+        job_id: int,
+        flush_rows: int = 50,
+        flush_interval: float = 2.0,
+        persist_interval: float = 10.0
+    ):
+        self.job_id = job_id
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.persist_interval = persist_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._processed = 0
+        self._failed = 0
+        self._unflushed = 0
+        self._persisted_processed = 0
+        self._persisted_failed = 0
+        self._last_persist = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+    
+    def record(self, failed: bool = False) -> None:
+        """Record one processed row, flushing if the batch is full."""
+        with self._lock:
+            self._processed += 1
+            self._unflushed += 1
+            if failed:
+                self._failed += 1
+            should_flush = self._unflushed >= self.flush_rows
+            if not should_flush and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
         
-        # Auto-complete when all rows processed
-        if processed_rows >= job_data["total_rows"]:
-            update_data["status"] = "completed"
-            update_data["completed_at"] = datetime.now().isoformat()
+        if should_flush:
+            self.flush()
+    
+    def flush(self, persist: bool = False) -> None:
+        """
+        Publish the running totals, and persist them if due.
         
-        supabase.schema("scraping").table("contact_scraper_jobs").update(update_data).eq("id", job_id).execute()
-    except Exception as e:
-        print(f"[!] Error incrementing job progress: {e}")
+        Args:
+            persist: Write the counters to Supabase even if persist_interval
+                has not elapsed yet
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._unflushed = 0
+                processed, failed = self._processed, self._failed
+            
+            publish_job_progress(self.job_id, processed, failed)
+            
+            if persist or time.monotonic() - self._last_persist >= self.persist_interval:
+                persisted = bulk_increment_job_progress(
+                    self.job_id,
+                    processed - self._persisted_processed,
+                    failed - self._persisted_failed
+                )
+                # After a failed write the same deltas are sent again next time
+                if persisted:
+                    self._persisted_processed, self._persisted_failed = processed, failed
+                self._last_persist = time.monotonic()
+    
+    def __enter__(self) -> "JobProgressAggregator":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # The final counts are what the finished job shows, so a failed write is retried
+        for attempt in range(JOB_PROGRESS_PERSIST_ATTEMPTS):
+            if attempt:
+                time.sleep(attempt)
+            self.flush(persist=True)
+            with self._lock:
+                persisted = (self._persisted_processed, self._persisted_failed) == (
+                    self._processed,
+                    self._failed,
+                )
+            if persisted:
+                # Otherwise the live counters stay visible until they expire
+                clear_job_progress(self.job_id)
+                return
+        logger.error("Could not persist the final progress of job %s", self.job_id)
 
 
 # Initialize tables on module load
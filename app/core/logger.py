@@ -0,0 +1,41 @@
+"""Logging configuration: records are written by a background thread."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+from app.core.config import get_settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging() -> None:
+    """
+    Route all log records through a queue to a single writer thread.
+
+    Worker threads only enqueue records; formatting and writing to stderr
+    happen on the QueueListener thread, so logging never blocks a worker on
+    I/O. Calling this more than once has no effect.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    settings = get_settings()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(settings.log_level.upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -1,6 +1,6 @@
 """Contact scraping request and response schemas."""
 
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -30,7 +30,9 @@ class ContactInfo(BaseModel):
         default_factory=lambda: {"company": [], "personal": []},
         description="LinkedIn URLs categorized by type (company/personal)",
     )
-    status: str = Field(..., description="Status of the scraping operation")
+    status: Literal["success", "no_contacts_found"] = Field(
+        ..., description="Status of the scraping operation"
+    )
 
     class Config:
         json_schema_extra = {
@@ -52,7 +54,7 @@ class ContactErrorResponse(BaseModel):
 
     website: str = Field(..., description="The website that failed to scrape")
     error: str = Field(..., description="Error message")
-    status: str = Field(default="error", description="Status indicator")
+    status: Literal["error"] = Field(default="error", description="Status indicator")
 
     class Config:
         json_schema_extra = {
@@ -64,6 +66,12 @@ class ContactErrorResponse(BaseModel):
         }
 
 
+# Result of /scrap, dispatched on "status" instead of trying each schema in turn
+ContactResult = Annotated[
+    Union[ContactInfo, ContactErrorResponse], Field(discriminator="status")
+]
+
+
 class LinkedInOnlyResponse(BaseModel):
     """LinkedIn-only scraping response schema."""
 
@@ -1,20 +1,71 @@
 """AI-powered services using OpenAI for contact validation and page detection."""
 
 import json
-from typing import Optional
-from urllib.parse import urljoin
+import logging
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+from urllib.parse import urljoin, urlparse
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import DefaultHttpxClient, OpenAI
 
 from app.core.config import get_settings
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
-client = OpenAI(api_key=settings.openai_api_key, timeout=settings.openai_timeout)
+# Keep-alive connection pool sized for the CSV workers so calls reuse TLS sessions
+client = OpenAI(
+    api_key=settings.openai_api_key,
+    timeout=settings.openai_timeout,
+    http_client=DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.http_pool_size,
+            max_keepalive_connections=settings.http_pool_size,
+        )
+    ),
+)
+
+# Path segments that identify a contact page without asking GPT; dedicated contact
+# pages are preferred over "about" pages
+_CONTACT_PATH_RE = re.compile(
+    r"/(?:contact|contact[-_]?us|kontakt|contato|contacto|contattaci|contactez[-_]?nous"
+    r"|reach[-_]?us|get[-_]?in[-_]?touch)(?:\.[a-z]+)?(?:/|$)",
+    re.IGNORECASE,
+)
+_ABOUT_PATH_RE = re.compile(r"/about(?:[-_]?us)?(?:\.[a-z]+)?(?:/|$)", re.IGNORECASE)
+
+
+def _match_contact_page(links: list[str]) -> Optional[str]:
+    """
+    Find a contact page by URL path alone.
+
+    Args:
+        links: List of internal links to check
+
+    Returns:
+        The link with the shortest path that looks like a contact page (or,
+        failing that, an about page), or None if no link matches
+    """
+    paths = [(urlparse(link).path, link) for link in links]
+    for pattern in (_CONTACT_PATH_RE, _ABOUT_PATH_RE):
+        # Rank matches instead of taking the first one on the page: nav menus
+        # often list deeper pages first, and the shortest path is the site's
+        # top-level page (/contact over /blog/contact/ or /de/contact/)
+        matches = [(len(path), link) for path, link in paths if pattern.search(path)]
+        if matches:
+            return min(matches)[1]
+    return None
 
 
 def find_contact_page(base_url: str, links: list[str]) -> Optional[str]:
     """
-    Use GPT to find the most likely contact page URL from a list of links.
+    Find the most likely contact page URL from a list of links.
+
+    Links with an obvious contact page path are picked directly; GPT is only
+    asked when none of them match.
 
     Args:
         base_url: The base website URL
@@ -23,6 +74,10 @@ def find_contact_page(base_url: str, links: list[str]) -> Optional[str]:
     Returns:
         Contact page URL if found, None otherwise
     """
+    contact_page = _match_contact_page(links)
+    if contact_page:
+        return contact_page
+
     limited_links = links[:20]  # Limit to save tokens
 
     prompt = f"""Given the following list of internal website links and the base URL, identify the most likely contact page URL.
@@ -41,7 +96,7 @@ If no contact page is found, return null.
             timeout=settings.openai_timeout,
         )
 
-        content = json.loads(response.choices[0].message.content.strip())
+        content = orjson.loads(response.choices[0].message.content.strip())
         contact_page = content.get("most_likely_contact_page")
 
         # Convert relative URL to absolute if not null
@@ -49,11 +104,76 @@ If no contact page is found, return null.
             return urljoin(base_url, contact_page)
 
     except Exception as e:
-        print(f"[!] Error finding contact page: {e}")
+        logger.error("Error finding contact page: %s", e)
 
     return None
 
 
+def find_contact_pages_batch(
+    items: list[tuple[str, list[str]]],
+) -> list[Optional[str]]:
+    """
+    Find the contact pages of several websites with a single GPT call.
+
+    Args:
+        items: One (base URL, internal links) tuple per website
+
+    Returns:
+        List of contact page URLs (None where none was found) in the same
+        order as items
+    """
+    results: list[Optional[str]] = [_match_contact_page(links) for _, links in items]
+    unmatched = [i for i, contact_page in enumerate(results) if not contact_page]
+    if len(unmatched) <= 1:
+        for i in unmatched:
+            results[i] = find_contact_page(*items[i])
+        return results
+
+    entries = [
+        {"id": i, "base_url": items[i][0], "links": items[i][1][:20]}  # Limit to save tokens
+        for i in unmatched
+    ]
+
+    prompt = f"""For each of the following {len(entries)} websites, identify the most likely contact page URL from its internal links.
+Entries: {json.dumps(entries, indent=2)}
+Return ONLY this JSON structure with no additional text, with exactly one result per entry and the same "id":
+{{"results": [{{"id": 0, "most_likely_contact_page": "URL_HERE"}}]}}
+The contact page could be named: contact, contact-us, contactez-nous, contattaci, kontakt, contato, contacto, about, reach-us, get-in-touch, etc.
+If no contact page is found for an entry, use null.
+"""
+
+    found_by_id = {}
+    try:
+        response = client.chat.completions.create(
+            model=settings.openai_model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0,
+            timeout=settings.openai_timeout,
+            response_format={"type": "json_object"},
+        )
+
+        content = orjson.loads(response.choices[0].message.content.strip())
+        for found in content.get("results", []):
+            if isinstance(found, dict) and isinstance(found.get("id"), int):
+                found_by_id[found["id"]] = found.get("most_likely_contact_page")
+
+    except Exception as e:
+        logger.error("Error finding contact pages batch: %s", e)
+
+    for i in unmatched:
+        if i not in found_by_id:
+            # Entry missing from the batch response; look it up on its own
+            results[i] = find_contact_page(*items[i])
+            continue
+
+        contact_page = found_by_id[i]
+        # Convert relative URL to absolute if not null
+        if isinstance(contact_page, str) and contact_page.lower() != "null":
+            results[i] = urljoin(items[i][0], contact_page)
+
+    return results
+
+
 def validate_contacts(
     emails: list[str],
     phones: list[str],
@@ -132,7 +252,7 @@ For phone numbers:
             timeout=settings.openai_timeout,
         )
 
-        validated = json.loads(response.choices[0].message.content.strip())
+        validated = orjson.loads(response.choices[0].message.content.strip())
 
         # If LinkedIn validation was disabled but URLs were provided, add them back without validation
         if not validate_linkedin and linkedin_urls:
@@ -141,8 +261,210 @@ For phone numbers:
         return validated
 
     except Exception as e:
-        print(f"[!] Error validating contacts: {e}")
+        logger.error("Error validating contacts: %s", e)
         result = {"valid_email": [], "valid_phones": []}
         if linkedin_urls:
             result["valid_linkedin_urls"] = linkedin_urls
         return result
+
+
+def validate_contacts_batch(items: list[dict]) -> list[dict[str, list[str]]]:
+    """
+    Validate the contacts extracted from several websites with a single GPT call.
+
+    Args:
+        items: One dict per website with 'emails', 'phones', and optionally
+            'linkedin_urls' and 'validate_linkedin' (same meaning as the
+            arguments of validate_contacts)
+
+    Returns:
+        List of validation results in the same order as items, each in the
+        format returned by validate_contacts
+    """
+    if len(items) == 1:
+        return [validate_contacts(**items[0])]
+
+    entries = []
+    for i, item in enumerate(items):
+        entry = {
+            "id": i,
+            "emails": list(set([e.strip().lower() for e in item["emails"]])),
+            "phones": list(set([p.strip() for p in item["phones"]])),
+        }
+        if item.get("validate_linkedin") and item.get("linkedin_urls"):
+            entry["linkedin_urls"] = item["linkedin_urls"]
+        entries.append(entry)
+
+    prompt = f"""Validate the following contact information extracted from {len(entries)} different websites.
+Return ONLY valid contact information in JSON format.
+
+Entries: {json.dumps(entries, indent=2)}
+
+Return ONLY this JSON structure with no additional text, with exactly one result per entry and the same "id":
+{{
+  "results": [
+    {{
+      "id": 0,
+      "valid_email": ["email1@domain.com", "email2@domain.com"],
+      "valid_phones": ["+1 202 555 0185", "123-456-7890"],
+      "valid_linkedin_urls": {{
+        "company": ["https://linkedin.com/company/example"],
+        "personal": ["https://linkedin.com/in/john-doe"]
+      }}
+    }}
+  ]
+}}
+
+Only include "valid_linkedin_urls" for entries that have "linkedin_urls".
+
+For phone numbers:
+- Include numbers that look like real phone numbers (7-15 digits)
+- Preserve formatting including "+" if present
+- Prefer international numbers first
+
+For LinkedIn URLs:
+- Only include valid, accessible LinkedIn URLs
+- Remove broken or invalid URLs
+- Keep company pages separate from personal profiles
+"""
+
+    validated_by_id = {}
+    try:
+        response = client.chat.completions.create(
+            model=settings.openai_model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0,
+            timeout=settings.openai_timeout,
+            response_format={"type": "json_object"},
+        )
+
+        content = orjson.loads(response.choices[0].message.content.strip())
+        for validated in content.get("results", []):
+            if isinstance(validated, dict) and isinstance(validated.get("id"), int):
+                validated_by_id[validated.pop("id")] = validated
+
+    except Exception as e:
+        logger.error("Error validating contacts batch: %s", e)
+
+    results = []
+    for i, item in enumerate(items):
+        validated = validated_by_id.get(i)
+        if validated is None:
+            # Entry missing from the batch response; validate it on its own
+            results.append(validate_contacts(**item))
+            continue
+
+        validated.setdefault("valid_email", [])
+        validated.setdefault("valid_phones", [])
+        # LinkedIn URLs that were not sent for validation are passed through as-is
+        if not item.get("validate_linkedin") and item.get("linkedin_urls"):
+            validated["valid_linkedin_urls"] = item["linkedin_urls"]
+        results.append(validated)
+
+    return results
+
+
+class _CallBatcher:
+    """
+    Collect concurrent calls into batched GPT requests.
+
+    Threads call submit() and block until their result is ready. A batch is
+    sent once ``batch_size`` calls are waiting, or when the oldest waiting call
+    has waited ``max_wait`` seconds.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[list], list],
+        batch_size: int,
+        max_wait: float = 1.0,
+    ):
+        self.send_batch = send_batch
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._pending: list[tuple[Any, Future]] = []
+
+    def submit(self, item: Any) -> Any:
+        """Add an item to the next batch and return its result."""
+        future = Future()
+        with self._lock:
+            self._pending.append((item, future))
+            batch = self._take_batch() if len(self._pending) >= self.batch_size else None
+
+        if batch is None:
+            try:
+                return future.result(timeout=self.max_wait)
+            except TimeoutError:
+                # Nobody filled the batch in time; send whatever is waiting
+                with self._lock:
+                    still_pending = any(f is future for _, f in self._pending)
+                    batch = self._take_batch() if still_pending else None
+
+        if batch:
+            self._send(batch)
+        return future.result()
+
+    def _take_batch(self) -> list[tuple[Any, Future]]:
+        """Remove and return the pending calls. Must hold the lock."""
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _send(self, batch: list[tuple[Any, Future]]) -> None:
+        """Send a batch and hand each result to its waiting caller."""
+        try:
+            results = self.send_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class ContactValidationBatcher(_CallBatcher):
+    """
+    Collect concurrent validate_contacts calls into batched GPT requests.
+
+    Threads call validate() exactly like validate_contacts and block until
+    their result is ready.
+    """
+
+    def __init__(self, batch_size: int, max_wait: float = 1.0):
+        super().__init__(validate_contacts_batch, batch_size, max_wait)
+
+    def validate(
+        self,
+        emails: list[str],
+        phones: list[str],
+        linkedin_urls: Optional[dict[str, list[str]]] = None,
+        validate_linkedin: bool = False,
+    ) -> dict[str, list[str]]:
+        """Validate contacts as part of the next batch; see validate_contacts."""
+        return self.submit(
+            {
+                "emails": emails,
+                "phones": phones,
+                "linkedin_urls": linkedin_urls,
+                "validate_linkedin": validate_linkedin,
+            }
+        )
+
+
+class ContactPageBatcher(_CallBatcher):
+    """
+    Collect concurrent find_contact_page calls into batched GPT requests.
+
+    Threads call find() exactly like find_contact_page. Links with an obvious
+    contact page path are answered immediately; only the rest wait for a batch.
+    """
+
+    def __init__(self, batch_size: int, max_wait: float = 1.0):
+        super().__init__(find_contact_pages_batch, batch_size, max_wait)
+
+    def find(self, base_url: str, links: list[str]) -> Optional[str]:
+        """Find a contact page as part of the next batch; see find_contact_page."""
+        contact_page = _match_contact_page(links)
+        if contact_page:
+            return contact_page
+        return self.submit((base_url, links))
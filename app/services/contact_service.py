@@ -1,28 +1,58 @@
 """Contact scraping service - main business logic."""
 
-from typing import Union
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional, Union
 
+from app.core.config import get_settings
 from app.core.database import get_contact_from_cache, save_contact_to_cache
 from app.schemas.contact import ContactErrorResponse, ContactInfo
 from app.services.ai_service import find_contact_page, validate_contacts
 from app.services.scraper_utils import (
-    extract_emails,
-    extract_linkedin_urls,
-    extract_links,
-    extract_phones,
+    dedupe_emails,
+    dedupe_phones,
+    extract_contacts,
     fetch_page,
     normalize_url,
 )
 
+# Scrapes currently running, keyed by normalized website and every scrape option.
+# Concurrent callers for the same website with the same options wait for the
+# first one's result instead of scraping it again.
+_INFLIGHT: dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def contact_info_from_cache(cached: dict) -> ContactInfo:
+    """
+    Build a ContactInfo response from a cached contact document.
+
+    Args:
+        cached: Contact information dict as stored in the cache
+
+    Returns:
+        ContactInfo for the cached website
+    """
+    return ContactInfo(**cached, status=cached.get("status", "success"))
+
 
 def scrape_website(
-    website: str, validate_linkedin: bool = False, skip_contact_page: bool = False
+    website: str,
+    validate_linkedin: bool = False,
+    skip_contact_page: bool = False,
+    validator: Callable[..., dict] = validate_contacts,
+    contact_page_finder: Callable[[str, list[str]], Optional[str]] = find_contact_page,
 ) -> Union[ContactInfo, ContactErrorResponse]:
     """
     Scrape a website for contact information including LinkedIn URLs.
 
     This function:
     1. Checks the cache for existing data
+       (concurrent calls for the same website and options share a single scrape)
     2. Scrapes the homepage for emails, phones, and LinkedIn URLs
     3. Uses AI to find and scrape a dedicated contact page (unless skip_contact_page=True)
     4. Validates extracted contacts using AI
@@ -32,6 +62,10 @@ def scrape_website(
         website: The website URL to scrape
         validate_linkedin: Whether to use AI to validate LinkedIn URLs (default: False)
         skip_contact_page: Skip AI contact page detection for faster results (default: False)
+        validator: Function used to validate the extracted contacts, with the
+            signature of validate_contacts (e.g. a ContactValidationBatcher's validate)
+        contact_page_finder: Function used to find the contact page, with the
+            signature of find_contact_page (e.g. a ContactPageBatcher's find)
 
     Returns:
         ContactInfo with scraped data or ContactErrorResponse on failure
@@ -44,43 +78,123 @@ def scrape_website(
     # 1. Check cache
     cached = get_contact_from_cache(website)
     if cached:
-        print("[Cache] Found existing contact info.")
-        return ContactInfo(**cached, status=cached.get("status", "success"))
+        logger.debug("[Cache] Found existing contact info.")
+        return contact_info_from_cache(cached)
+
+    # Callers with different options (e.g. skip_contact_page) get different results
+    inflight_key = (
+        website, validate_linkedin, skip_contact_page, validator, contact_page_finder
+    )
+    with _INFLIGHT_LOCK:
+        inflight = _INFLIGHT.get(inflight_key)
+        if inflight is None:
+            _INFLIGHT[inflight_key] = Future()
+
+    if inflight is not None:
+        logger.debug("[Scraper] Waiting for in-flight scrape of %s", website)
+        return inflight.result()
+
+    result = None
+    try:
+        result = _scrape_uncached(
+            website, validate_linkedin, skip_contact_page, validator, contact_page_finder
+        )
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.pop(inflight_key)
+        future.set_result(
+            result
+            or ContactErrorResponse(
+                website=website, error="Scrape failed unexpectedly", status="error"
+            )
+        )
+
+
+def _fetch_contact_page(
+    website: str,
+    links: list[str],
+    contact_page_finder: Callable[[str, list[str]], Optional[str]],
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Find a website's dedicated contact page and fetch it.
+
+    Args:
+        website: The normalized website URL
+        links: Internal links found on the homepage
+        contact_page_finder: Function used to find the contact page
+
+    Returns:
+        Tuple of (contact page URL, its HTML); the URL is None when no dedicated
+        contact page was found and the HTML is None when the fetch failed
+    """
+    logger.debug("[AI] Sending %s link(s) to AI to find contact page...", len(links))
+    contact_page = contact_page_finder(website, links)
+    if not contact_page or contact_page == website:
+        return None, None
+
+    logger.debug("[AI] Contact page found: %s", contact_page)
+    logger.debug("[Scraper] Fetching contact page...")
+    return contact_page, fetch_page(contact_page)
+
 
+def _scrape_uncached(
+    website: str,
+    validate_linkedin: bool,
+    skip_contact_page: bool,
+    validator: Callable[..., dict],
+    contact_page_finder: Callable[[str, list[str]], Optional[str]],
+) -> Union[ContactInfo, ContactErrorResponse]:
+    """
+    Scrape a normalized website that is not in the cache.
+
+    Args:
+        website: The normalized website URL
+        validate_linkedin: Whether to use AI to validate LinkedIn URLs
+        skip_contact_page: Skip AI contact page detection
+        validator: Function used to validate the extracted contacts
+        contact_page_finder: Function used to find the contact page
+
+    Returns:
+        ContactInfo with scraped data or ContactErrorResponse on failure
+    """
     try:
         # 2. Scrape homepage
-        print(f"[Scraper] Fetching homepage: {website}")
+        logger.debug("[Scraper] Fetching homepage: %s", website)
         html = fetch_page(website)
         if not html:
             raise Exception("Failed to fetch homepage")
 
-        print(f"[Scraper] Homepage fetched successfully")
-        emails = extract_emails(html)
-        phones = extract_phones(html)
-        linkedin_urls = extract_linkedin_urls(html)
-        links = extract_links(html, website)
+        logger.debug("[Scraper] Homepage fetched successfully")
+        emails, phones, linkedin_urls, links = extract_contacts(html, website)
 
         company_count = len(linkedin_urls.get("company", []))
         personal_count = len(linkedin_urls.get("personal", []))
-        print(
-            f"[Scraper] Found {len(emails)} email(s), {len(phones)} phone(s), {company_count} company LinkedIn URL(s), {personal_count} personal LinkedIn URL(s) on homepage"
+        logger.debug(
+            "[Scraper] Found %s email(s), %s phone(s), %s company LinkedIn URL(s), %s personal LinkedIn URL(s) on homepage",
+            len(emails),
+            len(phones),
+            company_count,
+            personal_count,
         )
 
-        # 3. Find and scrape contact page (unless skipped for speed)
+        # 3. Find and fetch the contact page (unless skipped for speed) and
+        # merge in its contacts. This stays sequential: the page URL comes from
+        # the homepage links, obvious contact pages are picked by path with no
+        # model call, and when the model is asked no link looked like one, so
+        # there is nothing worth fetching while it answers.
         if not skip_contact_page:
-            print(f"[AI] Sending {len(links)} link(s) to AI to find contact page...")
-            contact_page = find_contact_page(website, links)
-            if contact_page and contact_page != website:
-                print(f"[AI] Contact page found: {contact_page}")
-                print(f"[Scraper] Fetching contact page...")
-                c_html = fetch_page(contact_page)
+            contact_page, c_html = _fetch_contact_page(
+                website, links, contact_page_finder
+            )
+            if contact_page:
                 if c_html:
-                    c_emails = extract_emails(c_html)
-                    c_phones = extract_phones(c_html)
-                    c_linkedin = extract_linkedin_urls(c_html)
+                    c_emails, c_phones, c_linkedin, _ = extract_contacts(c_html)
 
-                    print(
-                        f"[Scraper] Found {len(c_emails)} email(s) and {len(c_phones)} phone(s) from contact page"
+                    logger.debug(
+                        "[Scraper] Found %s email(s) and %s phone(s) from contact page",
+                        len(c_emails),
+                        len(c_phones),
                     )
                     emails += c_emails
                     phones += c_phones
@@ -95,13 +209,23 @@ def scrape_website(
 
                     company_count = len(linkedin_urls["company"])
                     personal_count = len(linkedin_urls["personal"])
-                    print(
-                        f"[Scraper] Total: {len(emails)} email(s), {len(phones)} phone(s), {company_count} company LinkedIn URL(s), {personal_count} personal LinkedIn URL(s)"
+                    logger.debug(
+                        "[Scraper] Total: %s email(s), %s phone(s), %s company LinkedIn URL(s), %s personal LinkedIn URL(s)",
+                        len(emails),
+                        len(phones),
+                        company_count,
+                        personal_count,
                     )
             else:
-                print(f"[AI] No dedicated contact page found")
+                logger.debug("[AI] No dedicated contact page found")
         else:
-            print(f"[Scraper] Skipping contact page detection (fast mode enabled)")
+            logger.debug(
+                "[Scraper] Skipping contact page detection (fast mode enabled)"
+            )
+
+        # Drop repeats (e.g. footer contacts on both pages) before they reach the AI
+        emails = dedupe_emails(emails)
+        phones = dedupe_phones(phones)
 
         # 4. Handle no contacts found
         if (
@@ -110,7 +234,7 @@ def scrape_website(
             and not linkedin_urls.get("company")
             and not linkedin_urls.get("personal")
         ):
-            print("[Scraper] No contacts found on homepage or contact page")
+            logger.debug("[Scraper] No contacts found on homepage or contact page")
             result = ContactInfo(
                 website=website,
                 emails=[],
@@ -123,10 +247,13 @@ def scrape_website(
 
         # 5. Validate with AI
         linkedin_status = "with" if validate_linkedin else "without"
-        print(
-            f"[AI] Sending {len(emails)} email(s), {len(phones)} phone(s), and LinkedIn URLs to AI for validation ({linkedin_status} LinkedIn validation)..."
+        logger.debug(
+            "[AI] Sending %s email(s), %s phone(s), and LinkedIn URLs to AI for validation (%s LinkedIn validation)...",
+            len(emails),
+            len(phones),
+            linkedin_status,
         )
-        validation = validate_contacts(emails, phones, linkedin_urls, validate_linkedin)
+        validation = validator(emails, phones, linkedin_urls, validate_linkedin)
         valid_emails = validation.get("valid_email", [])
         valid_phones = validation.get("valid_phones", [])
         valid_linkedin = validation.get(
@@ -135,12 +262,16 @@ def scrape_website(
 
         company_count = len(valid_linkedin.get("company", []))
         personal_count = len(valid_linkedin.get("personal", []))
-        print(
-            f"[AI] Validation complete: {len(valid_emails)} valid email(s), {len(valid_phones)} valid phone(s), {company_count} company LinkedIn URL(s), {personal_count} personal LinkedIn URL(s)"
+        logger.debug(
+            "[AI] Validation complete: %s valid email(s), %s valid phone(s), %s company LinkedIn URL(s), %s personal LinkedIn URL(s)",
+            len(valid_emails),
+            len(valid_phones),
+            company_count,
+            personal_count,
         )
 
         # 6. Save to cache and return
-        print("[Cache] Saving validated contacts to cache")
+        logger.debug("[Cache] Saving validated contacts to cache")
         save_contact_to_cache(website, valid_emails, valid_phones, valid_linkedin)
 
         return ContactInfo(
@@ -153,7 +284,7 @@ def scrape_website(
 
     except Exception as e:
         error_message = str(e)
-        print(f"[!] Error scraping {website}: {error_message}")
+        logger.warning("Error scraping %s: %s", website, error_message)
         return ContactErrorResponse(
             website=website, error=error_message, status="error"
         )
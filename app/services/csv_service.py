@@ -1,6 +1,9 @@
 """CSV processing service for background jobs."""
 
-import json
+import csv
+import itertools
+import logging
+import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
@@ -9,20 +12,77 @@ import pandas as pd
 
 from app.core.config import get_settings
 from app.core.database import (
+    JobProgressAggregator,
     create_job,
+    get_contacts_from_cache_batch,
     get_job_status,
-    increment_job_progress,
     update_job_status,
 )
-from app.services.contact_service import scrape_website
+from app.services.ai_service import ContactPageBatcher, ContactValidationBatcher
+from app.services.contact_service import contact_info_from_cache, scrape_website
+from app.services.scraper_utils import normalize_url
 from app.services.storage_service import (
     download_csv_from_storage,
     upload_csv_to_storage,
 )
 from app.services.worker_service import submit_csv_job
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Columns added to every processed row (plus "error" in debug mode)
+RESULT_COLUMNS = (
+    "scrape_status",
+    "raw_json_response",
+    "email1",
+    "email2",
+    "email3",
+    "phone1",
+    "phone2",
+    "phone3",
+    "company_linkedin_url",
+    "personal_linkedin_url",
+)
+
+
+def count_csv_rows(csv_path: Path) -> int:
+    """
+    Count the data rows of a CSV file without loading it into memory.
+
+    Args:
+        csv_path: Path to the local CSV file
+
+    Returns:
+        Number of non-empty rows, excluding the header
+    """
+    with open(csv_path, newline="", encoding="utf-8", errors="replace") as f:
+        return max(sum(1 for row in csv.reader(f) if row) - 1, 0)
+
+
+def group_rows_by_website(websites: pd.Series) -> tuple[dict, list[list]]:
+    """
+    Normalize a column of websites and group the rows that point at the same site.
+
+    Args:
+        websites: Column of raw website values indexed by row
+
+    Returns:
+        Tuple of (row index -> normalized URL for rows with a valid URL, groups of
+        row indices sharing one website). Rows with an empty or invalid URL are
+        each placed in a group of their own.
+    """
+    normalized = {}
+    groups = {}
+    for index, website in websites.items():
+        key = ("row", index)
+        if not pd.isna(website) and str(website).strip():
+            try:
+                normalized[index] = key = normalize_url(str(website))
+            except ValueError:
+                pass
+        groups.setdefault(key, []).append(index)
+    return normalized, list(groups.values())
+
 
 def process_csv_background(
     job_id: int, input_path: str, original_filename: str, website_column: str
@@ -38,58 +98,70 @@ def process_csv_background(
     """
     try:
         # Update status to processing
-        print(f"[Job {job_id}] Starting CSV processing")
-        update_job_status(job_id, status="processing")
+        logger.info("[Job %s] Starting CSV processing", job_id)
+        if not update_job_status(job_id, status="processing"):
+            logger.error(
+                "[Job %s] Could not mark job as processing, not starting it",
+                job_id,
+            )
+            return
 
         # Download CSV from Supabase storage
-        print(f"[Job {job_id}] Downloading CSV from storage: {input_path}")
+        logger.info("[Job %s] Downloading CSV from storage: %s", job_id, input_path)
         csv_content = download_csv_from_storage(input_path)
         if not csv_content:
-            print(f"[Job {job_id}] Failed to download CSV from storage")
+            logger.error("[Job %s] Failed to download CSV from storage", job_id)
             update_job_status(
                 job_id, status="failed", error="Failed to download CSV from storage"
             )
             return
 
-        print(f"[Job {job_id}] CSV downloaded successfully")
-        # Read CSV
-        df = pd.read_csv(pd.io.common.BytesIO(csv_content))
-        print(f"[Job {job_id}] CSV loaded: {len(df)} rows, {len(df.columns)} columns")
+        logger.info("[Job %s] CSV downloaded successfully", job_id)
+        # Read CSV in chunks so only one chunk of rows is in memory at a time
+        chunks = pd.read_csv(
+            pd.io.common.BytesIO(csv_content), chunksize=settings.csv_chunk_size
+        )
+        first_chunk = next(chunks)
+        logger.info(
+            "[Job %s] CSV opened: %s columns, reading %s rows per chunk",
+            job_id,
+            len(first_chunk.columns),
+            settings.csv_chunk_size,
+        )
 
         # Validate website column exists
-        if website_column not in df.columns:
-            print(f"[Job {job_id}] Error: Column '{website_column}' not found")
+        if website_column not in first_chunk.columns:
+            logger.error(
+                "[Job %s] Error: Column '%s' not found", job_id, website_column
+            )
             update_job_status(
                 job_id,
                 status="failed",
-                error=f"Column '{website_column}' not found in CSV. Available columns: {', '.join(df.columns)}",
+                error=f"Column '{website_column}' not found in CSV. Available columns: {', '.join(first_chunk.columns)}",
             )
             return
 
-        print(f"[Job {job_id}] Adding result columns to CSV")
-        # Add result columns
-        df["scrape_status"] = ""
-        df["raw_json_response"] = ""
-        df["email1"] = ""
-        df["email2"] = ""
-        df["email3"] = ""
-        df["phone1"] = ""
-        df["phone2"] = ""
-        df["phone3"] = ""
-        df["company_linkedin_url"] = ""
-        df["personal_linkedin_url"] = ""
-
-        # Add error column only in debug mode
-        if settings.debug:
-            df["error"] = ""
-
         # Get concurrent workers setting (default 10)
         concurrent_workers = getattr(settings, "csv_concurrent_workers", 10)
-        print(
-            f"[Job {job_id}] Processing {len(df)} rows with {concurrent_workers} concurrent workers"
+        logger.info(
+            "[Job %s] Processing rows with %s concurrent workers",
+            job_id,
+            concurrent_workers,
+        )
+
+        # Validate contacts for several websites per OpenAI call. At most one
+        # call per worker thread can be waiting, so cap the batch at that.
+        validation_batcher = ContactValidationBatcher(
+            batch_size=min(settings.ai_validation_batch_size, concurrent_workers),
+            max_wait=settings.ai_validation_batch_wait,
+        )
+        # Contact page lookups that need GPT are batched the same way
+        contact_page_batcher = ContactPageBatcher(
+            batch_size=min(settings.ai_validation_batch_size, concurrent_workers),
+            max_wait=settings.ai_validation_batch_wait,
         )
 
-        def process_single_row(index, website):
+        def process_single_row(index, website, cached):
             """Process a single row and return the results."""
             if pd.isna(website) or not str(website).strip():
                 return {
@@ -100,15 +172,22 @@ def process_csv_background(
                 }
 
             try:
-                print(f"[Job {job_id}] Processing row {index + 1}: {website}")
-                result = scrape_website(str(website).strip())
-
-                # Convert result to dict for JSON storage
-                result_dict = result.model_dump()
+                logger.debug(
+                    "[Job %s] Processing row %s: %s", job_id, index + 1, website
+                )
+                if cached:
+                    result = contact_info_from_cache(cached)
+                else:
+                    result = scrape_website(
+                        str(website).strip(),
+                        validator=validation_batcher.validate,
+                        contact_page_finder=contact_page_batcher.find,
+                    )
 
                 row_data = {
                     "index": index,
-                    "raw_json_response": json.dumps(result_dict),
+                    # Serialized by pydantic-core, without an intermediate dict
+                    "raw_json_response": result.model_dump_json(),
                     "scrape_status": result.status,
                     "emails": result.emails if hasattr(result, "emails") else [],
                     "phones": result.phones if hasattr(result, "phones") else [],
@@ -119,13 +198,18 @@ def process_csv_background(
                     "failed": False,
                 }
 
-                print(
-                    f"[Job {job_id}] Row {index + 1} processed successfully: {result.status}"
+                logger.debug(
+                    "[Job %s] Row %s processed successfully: %s",
+                    job_id,
+                    index + 1,
+                    result.status,
                 )
                 return row_data
 
             except Exception as e:
-                print(f"[Job {job_id}] Error processing row {index + 1}: {e}")
+                logger.warning(
+                    "[Job %s] Error processing row %s: %s", job_id, index + 1, e
+                )
                 return {
                     "index": index,
                     "scrape_status": "error",
@@ -133,157 +217,206 @@ def process_csv_background(
                     "failed": True,
                 }
 
-        # Process rows concurrently
-        with ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
-            # Submit all tasks
-            future_to_row = {
-                executor.submit(process_single_row, index, row[website_column]): index
-                for index, row in df.iterrows()
+        def process_chunk(df, executor, progress):
+            """Scrape the websites of one chunk of rows and fill in its result columns."""
+            # Collect results per column and assign each column once at the end
+            columns = list(RESULT_COLUMNS)
+            if settings.debug:
+                # Add error column only in debug mode
+                columns.append("error")
+            results = {column: [""] * len(df) for column in columns}
+
+            # Scrape each distinct website once and fan the result out to its rows
+            # (websites repeated across chunks are served by the cache)
+            normalized_websites, row_groups = group_rows_by_website(df[website_column])
+            logger.info(
+                "[Job %s] %s distinct website(s) across %s rows",
+                job_id,
+                len(row_groups),
+                len(df),
+            )
+
+            # Look up cached contacts for every website in one Redis round-trip
+            cached_contacts = get_contacts_from_cache_batch(
+                list(set(normalized_websites.values()))
+            )
+            logger.info(
+                "[Job %s] Found %s cached website(s)", job_id, len(cached_contacts)
+            )
+
+            # Submit one task per distinct website
+            future_to_rows = {
+                executor.submit(
+                    process_single_row,
+                    rows[0],
+                    df.at[rows[0], website_column],
+                    cached_contacts.get(normalized_websites.get(rows[0])),
+                ): rows
+                for rows in row_groups
             }
 
             # Process completed tasks as they finish
-            for future in as_completed(future_to_row):
+            for future in as_completed(future_to_rows):
                 try:
                     row_data = future.result()
-                    index = row_data["index"]
-
-                    # Update DataFrame with results
-                    df.at[index, "scrape_status"] = row_data.get(
-                        "scrape_status", "error"
+                except Exception as e:
+                    logger.error(
+                        "[Job %s] Error processing future result: %s", job_id, e
                     )
+                    row_data = {"scrape_status": "error", "error": str(e), "failed": True}
+
+                # Build this website's output cells once, then copy them to its rows
+                row_values = {
+                    "scrape_status": row_data.get("scrape_status", "error"),
+                    "raw_json_response": row_data.get("raw_json_response", ""),
+                }
+
+                # Store emails and phones in separate columns
+                for i, email in enumerate((row_data.get("emails") or [])[:3]):
+                    row_values[f"email{i + 1}"] = email  # Max 3 emails
+                for i, phone in enumerate((row_data.get("phones") or [])[:3]):
+                    row_values[f"phone{i + 1}"] = phone  # Max 3 phones
 
-                    if "raw_json_response" in row_data:
-                        df.at[index, "raw_json_response"] = row_data[
-                            "raw_json_response"
-                        ]
-
-                    # Store emails in separate columns
-                    if "emails" in row_data and row_data["emails"]:
-                        for i, email in enumerate(
-                            row_data["emails"][:3]
-                        ):  # Max 3 emails
-                            df.at[index, f"email{i + 1}"] = email
-
-                    # Store phones in separate columns
-                    if "phones" in row_data and row_data["phones"]:
-                        for i, phone in enumerate(
-                            row_data["phones"][:3]
-                        ):  # Max 3 phones
-                            df.at[index, f"phone{i + 1}"] = phone
-
-                    # Store LinkedIn URLs
-                    if "linkedin_urls" in row_data and row_data["linkedin_urls"]:
-                        company_urls = row_data["linkedin_urls"].get("company", [])
-                        personal_urls = row_data["linkedin_urls"].get("personal", [])
-
-                        # Store first company URL in dedicated column
-                        if company_urls:
-                            df.at[index, "company_linkedin_url"] = company_urls[0]
-
-                        # Store all personal URLs in personal_linkedin_url column
-                        if personal_urls:
-                            df.at[index, "personal_linkedin_url"] = ", ".join(
-                                personal_urls
-                            )
-
-                    # Store error only in debug mode
-                    if settings.debug and row_data.get("error"):
-                        df.at[index, "error"] = row_data["error"]
+                # Store LinkedIn URLs
+                linkedin_urls = row_data.get("linkedin_urls") or {}
+                company_urls = linkedin_urls.get("company", [])
+                personal_urls = linkedin_urls.get("personal", [])
+
+                # Store first company URL in dedicated column
+                if company_urls:
+                    row_values["company_linkedin_url"] = company_urls[0]
+
+                # Store all personal URLs in personal_linkedin_url column
+                if personal_urls:
+                    row_values["personal_linkedin_url"] = ", ".join(personal_urls)
+
+                # Store error only in debug mode
+                if settings.debug and row_data.get("error"):
+                    row_values["error"] = row_data["error"]
+
+                for position in df.index.get_indexer(future_to_rows[future]):
+                    for column, value in row_values.items():
+                        results[column][position] = value
 
                     # Update progress
-                    increment_job_progress(job_id, failed=row_data.get("failed", False))
+                    progress.record(failed=row_data.get("failed", False))
 
-                except Exception as e:
-                    print(f"[Job {job_id}] Error processing future result: {e}")
-                    index = future_to_row[future]
-                    df.at[index, "scrape_status"] = "error"
-                    if settings.debug:
-                        df.at[index, "error"] = str(e)
-                    increment_job_progress(job_id, failed=True)
-
-        print(f"[Job {job_id}] All rows processed, saving output CSV")
-        # Save processed CSV to bytes
-        output_buffer = pd.io.common.BytesIO()
-        df.to_csv(output_buffer, index=False)
-        output_content = output_buffer.getvalue()
-
-        # Upload processed CSV to Supabase storage
-        print(f"[Job {job_id}] Uploading processed CSV to storage")
-        output_path = upload_csv_to_storage(
-            job_id, output_content, original_filename, is_output=True
-        )
+            for column, values in results.items():
+                df[column] = values
 
-        if output_path:
-            print(f"[Job {job_id}] Output CSV uploaded to storage: {output_path}")
-            print(f"[Job {job_id}] Job completed successfully")
-            # Mark as completed and store output path
-            update_job_status(job_id, status="completed", output_path=output_path)
-        else:
-            print(f"[Job {job_id}] Failed to upload output CSV")
-            update_job_status(
-                job_id,
-                status="failed",
-                error="Failed to upload processed CSV to storage",
+        # Process chunks one at a time, rows within a chunk concurrently, and
+        # append each finished chunk to a local output file.
+        # Progress is batched in memory and flushed periodically
+        output_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".csv", newline="", encoding="utf-8", delete=False
+        )
+        output_csv_path = Path(output_file.name)
+        try:
+            with output_file, ThreadPoolExecutor(
+                max_workers=concurrent_workers
+            ) as executor, JobProgressAggregator(job_id) as progress:
+                for chunk_number, df in enumerate(
+                    itertools.chain([first_chunk], chunks)
+                ):
+                    process_chunk(df, executor, progress)
+                    df.to_csv(output_file, index=False, header=chunk_number == 0)
+
+            logger.info("[Job %s] All rows processed, output CSV saved", job_id)
+
+            # Upload processed CSV to Supabase storage
+            logger.info("[Job %s] Uploading processed CSV to storage", job_id)
+            output_path = upload_csv_to_storage(
+                job_id, output_csv_path, original_filename, is_output=True
             )
 
+            if output_path:
+                logger.info(
+                    "[Job %s] Output CSV uploaded to storage: %s", job_id, output_path
+                )
+                # Mark as completed and store output path
+                if update_job_status(job_id, status="completed", output_path=output_path):
+                    logger.info("[Job %s] Job completed successfully", job_id)
+                else:
+                    # Don't leave the job in processing when the completion
+                    # write is lost
+                    logger.error("[Job %s] Could not mark job as completed", job_id)
+                    update_job_status(
+                        job_id,
+                        status="failed",
+                        error="Failed to record job completion",
+                    )
+            else:
+                logger.error("[Job %s] Failed to upload output CSV", job_id)
+                update_job_status(
+                    job_id,
+                    status="failed",
+                    error="Failed to upload processed CSV to storage",
+                )
+        finally:
+            output_csv_path.unlink(missing_ok=True)
+
     except Exception as e:
-        print(f"[Job {job_id}] Fatal error: {e}")
+        logger.error("[Job %s] Fatal error: %s", job_id, e)
         update_job_status(job_id, status="failed", error=str(e))
 
 
 def start_csv_processing(
-    csv_content: bytes, original_filename: str, website_column: str = "website"
+    csv_path: Path, original_filename: str, website_column: str = "website"
 ) -> Optional[int]:
     """
     Start processing a CSV file in a background worker.
 
     Args:
-        csv_content: CSV file content as bytes
+        csv_path: Path to the uploaded CSV file on local disk
         original_filename: Original filename of the uploaded CSV
         website_column: Name of the column containing website URLs
 
     Returns:
         The job ID (integer) if successful, None otherwise
     """
-    print(f"[CSV Upload] Processing file: {original_filename}")
-    # Read CSV to get row count first
-    df = pd.read_csv(pd.io.common.BytesIO(csv_content))
-    total_rows = len(df)
-    print(f"[CSV Upload] CSV contains {total_rows} rows")
+    logger.info("[CSV Upload] Processing file: %s", original_filename)
+    # Count rows first with a streaming pass (the worker parses the full CSV)
+    total_rows = count_csv_rows(csv_path)
+    logger.info("[CSV Upload] CSV contains %s rows", total_rows)
 
     # Create job in database first to get the auto-generated ID
-    print(f"[CSV Upload] Creating job in database")
+    logger.info("[CSV Upload] Creating job in database")
     job_id = create_job(total_rows, None, original_filename)
 
     if not job_id:
-        print(f"[CSV Upload] Failed to create job in database")
+        logger.error("[CSV Upload] Failed to create job in database")
         return None
 
-    print(f"[CSV Upload] Job created with ID: {job_id}")
+    logger.info("[CSV Upload] Job created with ID: %s", job_id)
 
     # Upload CSV to Supabase storage with the job ID
-    print(f"[CSV Upload] Uploading CSV to storage")
+    logger.info("[CSV Upload] Uploading CSV to storage")
     input_path = upload_csv_to_storage(
-        job_id, csv_content, original_filename, is_output=False
+        job_id, csv_path, original_filename, is_output=False
     )
 
     if not input_path:
-        print(f"[Job {job_id}] Failed to upload CSV to storage")
+        logger.error("[Job %s] Failed to upload CSV to storage", job_id)
         update_job_status(
             job_id, status="failed", error="Failed to upload CSV to storage"
         )
         return None
 
-    print(f"[Job {job_id}] CSV uploaded to storage: {input_path}")
+    logger.info("[Job %s] CSV uploaded to storage: %s", job_id, input_path)
 
     # Update job with input path
     update_job_status(job_id, input_path=input_path)
 
     # Submit job to worker pool (max 2 concurrent jobs)
-    print(f"[Job {job_id}] Submitting to worker pool")
+    logger.info("[Job %s] Submitting to worker pool", job_id)
     submit_csv_job(
-        process_csv_background, job_id, input_path, original_filename, website_column
+        job_id,
+        process_csv_background,
+        job_id,
+        input_path,
+        original_filename,
+        website_column,
     )
 
-    print(f"[Job {job_id}] Job queued successfully for {total_rows} rows")
+    logger.info("[Job %s] Job queued successfully for %s rows", job_id, total_rows)
     return job_id
@@ -1,26 +1,113 @@
 """LinkedIn-only CSV processing service for background jobs with concurrent scraping."""
 
-import json
+import itertools
+import logging
+import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 
 from app.core.config import get_settings
 from app.core.database import (
+    JobProgressAggregator,
     create_job,
-    increment_job_progress,
     update_job_status,
 )
-from app.services.linkedin_service import scrape_linkedin_only
+from app.services.csv_service import count_csv_rows, group_rows_by_website
+from app.services.linkedin_service import (
+    get_linkedin_from_cache_batch,
+    linkedin_info_from_cache,
+    scrape_linkedin_only,
+)
+from app.services.scraper_utils import normalize_url
 from app.services.storage_service import (
     download_csv_from_storage,
     upload_csv_to_storage,
 )
 from app.services.worker_service import submit_csv_job
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# LinkedIn-specific columns added to every processed row (plus "error" in debug mode)
+RESULT_COLUMNS = ("company_linkedin", "personal_linkedin", "scrape_status")
+
+
+def _process_single_row(
+    job_id: int, index: int, website, cached: Optional[dict] = None
+) -> dict:
+    """
+    Scrape the LinkedIn URLs of a single CSV row.
+
+    Defined at module level (rather than as a closure inside the job) so the
+    function is picklable and holds no job state beyond its arguments.
+
+    Args:
+        job_id: Job the row belongs to (used in log messages)
+        index: Row index in the input CSV
+        website: Raw website value of the row
+        cached: Cached LinkedIn data for the website, if any
+
+    Returns:
+        Dict with the row's scrape status, LinkedIn URLs, error and failed flag
+    """
+    if pd.isna(website) or not str(website).strip():
+        return {
+            "index": index,
+            "scrape_status": "skipped",
+            "error": "Empty website URL",
+            "failed": True,
+        }
+
+    try:
+        logger.debug(
+            "[LinkedIn Job %s] Processing row %s: %s",
+            job_id,
+            index + 1,
+            website,
+        )
+        if cached:
+            result = linkedin_info_from_cache(normalize_url(str(website)), cached)
+        else:
+            result = scrape_linkedin_only(str(website).strip())
+
+        row_data = {
+            "index": index,
+            "scrape_status": result.status,
+            "company_linkedin": result.company_linkedin
+            if hasattr(result, "company_linkedin")
+            else [],
+            "personal_linkedin": result.personal_linkedin
+            if hasattr(result, "personal_linkedin")
+            else [],
+            "error": result.error if hasattr(result, "error") else None,
+            "failed": False,
+        }
+
+        logger.debug(
+            "[LinkedIn Job %s] Row %s processed successfully: %s",
+            job_id,
+            index + 1,
+            result.status,
+        )
+        return row_data
+
+    except Exception as e:
+        logger.warning(
+            "[LinkedIn Job %s] Error processing row %s: %s",
+            job_id,
+            index + 1,
+            e,
+        )
+        return {
+            "index": index,
+            "scrape_status": "error",
+            "error": str(e),
+            "failed": True,
+        }
+
 
 def process_linkedin_csv_background(
     job_id: int, input_path: str, original_filename: str, website_column: str
@@ -36,224 +123,254 @@ def process_linkedin_csv_background(
     """
     try:
         # Update status to processing
-        print(f"[LinkedIn Job {job_id}] Starting CSV processing")
-        update_job_status(job_id, status="processing")
+        logger.info("[LinkedIn Job %s] Starting CSV processing", job_id)
+        if not update_job_status(job_id, status="processing"):
+            logger.error(
+                "[LinkedIn Job %s] Could not mark job as processing, not starting it",
+                job_id,
+            )
+            return
 
         # Download CSV from Supabase storage
-        print(f"[LinkedIn Job {job_id}] Downloading CSV from storage: {input_path}")
+        logger.info(
+            "[LinkedIn Job %s] Downloading CSV from storage: %s", job_id, input_path
+        )
         csv_content = download_csv_from_storage(input_path)
         if not csv_content:
-            print(f"[LinkedIn Job {job_id}] Failed to download CSV from storage")
+            logger.error(
+                "[LinkedIn Job %s] Failed to download CSV from storage", job_id
+            )
             update_job_status(
                 job_id, status="failed", error="Failed to download CSV from storage"
             )
             return
 
-        print(f"[LinkedIn Job {job_id}] CSV downloaded successfully")
-        # Read CSV
-        df = pd.read_csv(pd.io.common.BytesIO(csv_content))
-        print(
-            f"[LinkedIn Job {job_id}] CSV loaded: {len(df)} rows, {len(df.columns)} columns"
+        logger.info("[LinkedIn Job %s] CSV downloaded successfully", job_id)
+        # Read CSV in chunks so only one chunk of rows is in memory at a time
+        chunks = pd.read_csv(
+            pd.io.common.BytesIO(csv_content), chunksize=settings.csv_chunk_size
+        )
+        first_chunk = next(chunks)
+        logger.info(
+            "[LinkedIn Job %s] CSV opened: %s columns, reading %s rows per chunk",
+            job_id,
+            len(first_chunk.columns),
+            settings.csv_chunk_size,
         )
 
         # Validate website column exists
-        if website_column not in df.columns:
-            print(f"[LinkedIn Job {job_id}] Error: Column '{website_column}' not found")
+        if website_column not in first_chunk.columns:
+            logger.error(
+                "[LinkedIn Job %s] Error: Column '%s' not found", job_id, website_column
+            )
             update_job_status(
                 job_id,
                 status="failed",
-                error=f"Column '{website_column}' not found in CSV. Available columns: {', '.join(df.columns)}",
+                error=f"Column '{website_column}' not found in CSV. Available columns: {', '.join(first_chunk.columns)}",
             )
             return
 
-        print(f"[LinkedIn Job {job_id}] Adding LinkedIn result columns to CSV")
-        # Add LinkedIn-specific result columns (only 2 columns)
-        df["company_linkedin"] = ""
-        df["personal_linkedin"] = ""
-        df["scrape_status"] = ""
-
-        # Add error column only in debug mode
-        if settings.debug:
-            df["error"] = ""
-
         # Get concurrent workers setting (default 10)
         concurrent_workers = getattr(settings, "csv_concurrent_workers", 10)
-        print(
-            f"[LinkedIn Job {job_id}] Processing {len(df)} rows with {concurrent_workers} concurrent workers"
+        logger.info(
+            "[LinkedIn Job %s] Processing rows with %s concurrent workers",
+            job_id,
+            concurrent_workers,
         )
 
-        def process_single_row(index, website):
-            """Process a single row and return the results."""
-            if pd.isna(website) or not str(website).strip():
-                return {
-                    "index": index,
-                    "scrape_status": "skipped",
-                    "error": "Empty website URL",
-                    "failed": True,
-                }
-
-            try:
-                print(f"[LinkedIn Job {job_id}] Processing row {index + 1}: {website}")
-                result = scrape_linkedin_only(str(website).strip())
-
-                row_data = {
-                    "index": index,
-                    "scrape_status": result.status,
-                    "company_linkedin": result.company_linkedin
-                    if hasattr(result, "company_linkedin")
-                    else [],
-                    "personal_linkedin": result.personal_linkedin
-                    if hasattr(result, "personal_linkedin")
-                    else [],
-                    "error": result.error if hasattr(result, "error") else None,
-                    "failed": False,
-                }
-
-                print(
-                    f"[LinkedIn Job {job_id}] Row {index + 1} processed successfully: {result.status}"
-                )
-                return row_data
-
-            except Exception as e:
-                print(f"[LinkedIn Job {job_id}] Error processing row {index + 1}: {e}")
-                return {
-                    "index": index,
-                    "scrape_status": "error",
-                    "error": str(e),
-                    "failed": True,
-                }
-
-        # Process rows concurrently
-        with ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
-            # Submit all tasks
-            future_to_row = {
-                executor.submit(process_single_row, index, row[website_column]): index
-                for index, row in df.iterrows()
+        def process_chunk(df, executor, progress):
+            """Scrape the websites of one chunk of rows and fill in its result columns."""
+            # Collect results per column and assign each column once at the end
+            columns = list(RESULT_COLUMNS)
+            if settings.debug:
+                # Add error column only in debug mode
+                columns.append("error")
+            results = {column: [""] * len(df) for column in columns}
+
+            # Scrape each distinct website once and fan the result out to its rows
+            # (websites repeated across chunks are served by the cache)
+            normalized_websites, row_groups = group_rows_by_website(df[website_column])
+            logger.info(
+                "[LinkedIn Job %s] %s distinct website(s) across %s rows",
+                job_id,
+                len(row_groups),
+                len(df),
+            )
+
+            # Look up cached LinkedIn results for every website in one Redis round-trip
+            cached_linkedin = get_linkedin_from_cache_batch(
+                list(set(normalized_websites.values()))
+            )
+            logger.info(
+                "[LinkedIn Job %s] Found %s cached website(s)",
+                job_id,
+                len(cached_linkedin),
+            )
+
+            # Submit one task per distinct website
+            future_to_rows = {
+                executor.submit(
+                    _process_single_row,
+                    job_id,
+                    rows[0],
+                    df.at[rows[0], website_column],
+                    cached_linkedin.get(normalized_websites.get(rows[0])),
+                ): rows
+                for rows in row_groups
             }
 
             # Process completed tasks as they finish
-            for future in as_completed(future_to_row):
+            for future in as_completed(future_to_rows):
                 try:
                     row_data = future.result()
-                    index = row_data["index"]
-
-                    # Update DataFrame with results
-                    df.at[index, "scrape_status"] = row_data.get(
-                        "scrape_status", "error"
+                except Exception as e:
+                    logger.error(
+                        "[LinkedIn Job %s] Error processing future result: %s",
+                        job_id,
+                        e,
                     )
+                    row_data = {"scrape_status": "error", "error": str(e), "failed": True}
 
-                    # Store LinkedIn URLs in 2 columns (comma-separated if multiple)
-                    if "company_linkedin" in row_data and row_data["company_linkedin"]:
-                        company_urls = row_data["company_linkedin"]
-                        df.at[index, "company_linkedin"] = ", ".join(company_urls)
+                # Build this website's output cells once, then copy them to its rows
+                row_values = {"scrape_status": row_data.get("scrape_status", "error")}
 
-                    if (
-                        "personal_linkedin" in row_data
-                        and row_data["personal_linkedin"]
-                    ):
-                        personal_urls = row_data["personal_linkedin"]
-                        df.at[index, "personal_linkedin"] = ", ".join(personal_urls)
+                # Store LinkedIn URLs in 2 columns (comma-separated if multiple)
+                if row_data.get("company_linkedin"):
+                    row_values["company_linkedin"] = ", ".join(
+                        row_data["company_linkedin"]
+                    )
+                if row_data.get("personal_linkedin"):
+                    row_values["personal_linkedin"] = ", ".join(
+                        row_data["personal_linkedin"]
+                    )
 
-                    # Store error only in debug mode
-                    if settings.debug and row_data.get("error"):
-                        df.at[index, "error"] = row_data["error"]
+                # Store error only in debug mode
+                if settings.debug and row_data.get("error"):
+                    row_values["error"] = row_data["error"]
+
+                for position in df.index.get_indexer(future_to_rows[future]):
+                    for column, value in row_values.items():
+                        results[column][position] = value
 
                     # Update progress
-                    increment_job_progress(job_id, failed=row_data.get("failed", False))
+                    progress.record(failed=row_data.get("failed", False))
 
-                except Exception as e:
-                    print(
-                        f"[LinkedIn Job {job_id}] Error processing future result: {e}"
-                    )
-                    index = future_to_row[future]
-                    df.at[index, "scrape_status"] = "error"
-                    if settings.debug:
-                        df.at[index, "error"] = str(e)
-                    increment_job_progress(job_id, failed=True)
-
-        print(f"[LinkedIn Job {job_id}] All rows processed, saving output CSV")
-        # Save processed CSV to bytes
-        output_buffer = pd.io.common.BytesIO()
-        df.to_csv(output_buffer, index=False)
-        output_content = output_buffer.getvalue()
-
-        # Upload processed CSV to Supabase storage
-        print(f"[LinkedIn Job {job_id}] Uploading processed CSV to storage")
-        output_path = upload_csv_to_storage(
-            job_id, output_content, original_filename, is_output=True
-        )
+            for column, values in results.items():
+                df[column] = values
 
-        if output_path:
-            print(
-                f"[LinkedIn Job {job_id}] Output CSV uploaded to storage: {output_path}"
+        # Process chunks one at a time, rows within a chunk concurrently, and
+        # append each finished chunk to a local output file.
+        # Progress is batched in memory and flushed periodically
+        output_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".csv", newline="", encoding="utf-8", delete=False
+        )
+        output_csv_path = Path(output_file.name)
+        try:
+            with output_file, ThreadPoolExecutor(
+                max_workers=concurrent_workers
+            ) as executor, JobProgressAggregator(job_id) as progress:
+                for chunk_number, df in enumerate(
+                    itertools.chain([first_chunk], chunks)
+                ):
+                    process_chunk(df, executor, progress)
+                    df.to_csv(output_file, index=False, header=chunk_number == 0)
+
+            logger.info(
+                "[LinkedIn Job %s] All rows processed, output CSV saved", job_id
             )
-            print(f"[LinkedIn Job {job_id}] Job completed successfully")
-            # Mark as completed and store output path
-            update_job_status(job_id, status="completed", output_path=output_path)
-        else:
-            print(f"[LinkedIn Job {job_id}] Failed to upload output CSV")
-            update_job_status(
-                job_id,
-                status="failed",
-                error="Failed to upload processed CSV to storage",
+
+            # Upload processed CSV to Supabase storage
+            logger.info("[LinkedIn Job %s] Uploading processed CSV to storage", job_id)
+            output_path = upload_csv_to_storage(
+                job_id, output_csv_path, original_filename, is_output=True
             )
 
+            if output_path:
+                logger.info(
+                    "[LinkedIn Job %s] Output CSV uploaded to storage: %s",
+                    job_id,
+                    output_path,
+                )
+                # Mark as completed and store output path
+                if update_job_status(job_id, status="completed", output_path=output_path):
+                    logger.info("[LinkedIn Job %s] Job completed successfully", job_id)
+                else:
+                    # Don't leave the job in processing when the completion
+                    # write is lost
+                    logger.error(
+                        "[LinkedIn Job %s] Could not mark job as completed", job_id
+                    )
+                    update_job_status(
+                        job_id,
+                        status="failed",
+                        error="Failed to record job completion",
+                    )
+            else:
+                logger.error("[LinkedIn Job %s] Failed to upload output CSV", job_id)
+                update_job_status(
+                    job_id,
+                    status="failed",
+                    error="Failed to upload processed CSV to storage",
+                )
+        finally:
+            output_csv_path.unlink(missing_ok=True)
+
     except Exception as e:
-        print(f"[LinkedIn Job {job_id}] Fatal error: {e}")
+        logger.error("[LinkedIn Job %s] Fatal error: %s", job_id, e)
         update_job_status(job_id, status="failed", error=str(e))
 
 
 def start_linkedin_csv_processing(
-    csv_content: bytes, original_filename: str, website_column: str = "website"
+    csv_path: Path, original_filename: str, website_column: str = "website"
 ) -> Optional[int]:
     """
     Start processing a CSV file for LinkedIn-only scraping in a background worker.
 
     Args:
-        csv_content: CSV file content as bytes
+        csv_path: Path to the uploaded CSV file on local disk
         original_filename: Original filename of the uploaded CSV
         website_column: Name of the column containing website URLs
 
     Returns:
         The job ID (integer) if successful, None otherwise
     """
-    print(f"[LinkedIn CSV Upload] Processing file: {original_filename}")
-    # Read CSV to get row count first
-    df = pd.read_csv(pd.io.common.BytesIO(csv_content))
-    total_rows = len(df)
-    print(f"[LinkedIn CSV Upload] CSV contains {total_rows} rows")
+    logger.info("[LinkedIn CSV Upload] Processing file: %s", original_filename)
+    # Count rows first with a streaming pass (the worker parses the full CSV)
+    total_rows = count_csv_rows(csv_path)
+    logger.info("[LinkedIn CSV Upload] CSV contains %s rows", total_rows)
 
     # Create job in database first to get the auto-generated ID
-    print(f"[LinkedIn CSV Upload] Creating job in database")
+    logger.info("[LinkedIn CSV Upload] Creating job in database")
     job_id = create_job(total_rows, None, original_filename)
 
     if not job_id:
-        print(f"[LinkedIn CSV Upload] Failed to create job in database")
+        logger.error("[LinkedIn CSV Upload] Failed to create job in database")
         return None
 
-    print(f"[LinkedIn CSV Upload] Job created with ID: {job_id}")
+    logger.info("[LinkedIn CSV Upload] Job created with ID: %s", job_id)
 
     # Upload CSV to Supabase storage with the job ID
-    print(f"[LinkedIn CSV Upload] Uploading CSV to storage")
+    logger.info("[LinkedIn CSV Upload] Uploading CSV to storage")
     input_path = upload_csv_to_storage(
-        job_id, csv_content, original_filename, is_output=False
+        job_id, csv_path, original_filename, is_output=False
     )
 
     if not input_path:
-        print(f"[LinkedIn Job {job_id}] Failed to upload CSV to storage")
+        logger.error("[LinkedIn Job %s] Failed to upload CSV to storage", job_id)
         update_job_status(
             job_id, status="failed", error="Failed to upload CSV to storage"
         )
         return None
 
-    print(f"[LinkedIn Job {job_id}] CSV uploaded to storage: {input_path}")
+    logger.info("[LinkedIn Job %s] CSV uploaded to storage: %s", job_id, input_path)
 
     # Update job with input path
     update_job_status(job_id, input_path=input_path)
 
     # Submit job to worker pool (max 2 concurrent jobs)
-    print(f"[LinkedIn Job {job_id}] Submitting to worker pool")
+    logger.info("[LinkedIn Job %s] Submitting to worker pool", job_id)
     submit_csv_job(
+        job_id,
         process_linkedin_csv_background,
         job_id,
         input_path,
@@ -261,5 +378,7 @@ def start_linkedin_csv_processing(
         website_column,
     )
 
-    print(f"[LinkedIn Job {job_id}] Job queued successfully for {total_rows} rows")
+    logger.info(
+        "[LinkedIn Job %s] Job queued successfully for %s rows", job_id, total_rows
+    )
     return job_id
@@ -1,10 +1,12 @@
 """LinkedIn-only scraping service - fast extraction without AI validation."""
 
-import json
+import logging
 from typing import Union
 
+import orjson
+
 from app.core.config import get_settings
-from app.core.database import redis_client
+from app.core.database import CACHE_MGET_CHUNK_SIZE, redis_client
 from app.schemas.contact import LinkedInErrorResponse, LinkedInOnlyResponse
 from app.services.scraper_utils import (
     extract_linkedin_urls,
@@ -12,9 +14,59 @@ from app.services.scraper_utils import (
     normalize_url,
 )
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def get_linkedin_from_cache_batch(websites: list[str]) -> dict[str, dict]:
+    """
+    Retrieve cached LinkedIn-only results for many websites in one Redis round-trip.
+
+    Args:
+        websites: List of normalized website URLs
+
+    Returns:
+        Dict mapping each cached website to its cached LinkedIn data
+        (websites without a cache entry are omitted)
+    """
+    if not websites:
+        return {}
+    try:
+        # One MGET per chunk of keys, all sent in a single pipelined round-trip
+        pipe = redis_client.pipeline(transaction=False)
+        for start in range(0, len(websites), CACHE_MGET_CHUNK_SIZE):
+            chunk = websites[start:start + CACHE_MGET_CHUNK_SIZE]
+            pipe.mget([f"linkedin:{website}" for website in chunk])
+        results = [data for chunk_results in pipe.execute() for data in chunk_results]
+        return {
+            website: orjson.loads(data)
+            for website, data in zip(websites, results)
+            if data
+        }
+    except Exception as e:
+        logger.error("Error retrieving batch from LinkedIn cache: %s", e)
+        return {}
+
+
+def linkedin_info_from_cache(website: str, cached: dict) -> LinkedInOnlyResponse:
+    """
+    Build a LinkedInOnlyResponse from cached LinkedIn data.
+
+    Args:
+        website: The normalized website URL
+        cached: LinkedIn data as stored in the LinkedIn-only cache
+
+    Returns:
+        LinkedInOnlyResponse for the cached website
+    """
+    return LinkedInOnlyResponse(
+        website=website,
+        company_linkedin=cached.get("company_linkedin", []),
+        personal_linkedin=cached.get("personal_linkedin", []),
+        status="success",
+    )
+
+
 def scrape_linkedin_only(
     website: str,
 ) -> Union[LinkedInOnlyResponse, LinkedInErrorResponse]:
@@ -42,34 +94,32 @@ def scrape_linkedin_only(
     try:
         cached = redis_client.get(cache_key)
         if cached:
-            print(f"[LinkedIn Cache] Found existing LinkedIn info for {website}")
-            cached_data = json.loads(cached)
-            return LinkedInOnlyResponse(
-                website=website,
-                company_linkedin=cached_data.get("company_linkedin", []),
-                personal_linkedin=cached_data.get("personal_linkedin", []),
-                status="success",
+            logger.debug(
+                "[LinkedIn Cache] Found existing LinkedIn info for %s", website
             )
+            return linkedin_info_from_cache(website, orjson.loads(cached))
     except Exception as e:
-        print(f"[!] Error retrieving from LinkedIn cache: {e}")
+        logger.error("Error retrieving from LinkedIn cache: %s", e)
 
     try:
         # 2. Scrape homepage only
-        print(f"[LinkedIn Scraper] Fetching homepage: {website}")
+        logger.debug("[LinkedIn Scraper] Fetching homepage: %s", website)
         html = fetch_page(website)
         if not html:
             raise Exception("Failed to fetch homepage")
 
-        print(f"[LinkedIn Scraper] Homepage fetched successfully")
+        logger.debug("[LinkedIn Scraper] Homepage fetched successfully")
 
         # 3. Extract LinkedIn URLs only (no emails, no phones)
         linkedin_urls = extract_linkedin_urls(html)
 
         company_count = len(linkedin_urls.get("company", []))
         personal_count = len(linkedin_urls.get("personal", []))
-        print(
-            f"[LinkedIn Scraper] Found {company_count} company LinkedIn URL(s), "
-            f"{personal_count} personal LinkedIn URL(s)"
+        logger.debug(
+            "[LinkedIn Scraper] Found %s company LinkedIn URL(s), "
+            "%s personal LinkedIn URL(s)",
+            company_count,
+            personal_count,
         )
 
         company_urls = linkedin_urls.get("company", [])
@@ -77,7 +127,7 @@ def scrape_linkedin_only(
 
         # 4. Handle no LinkedIn URLs found
         if not company_urls and not personal_urls:
-            print(f"[LinkedIn Scraper] No LinkedIn URLs found on {website}")
+            logger.debug("[LinkedIn Scraper] No LinkedIn URLs found on %s", website)
             result = LinkedInOnlyResponse(
                 website=website,
                 company_linkedin=[],
@@ -90,25 +140,33 @@ def scrape_linkedin_only(
                     "company_linkedin": [],
                     "personal_linkedin": [],
                 }
-                redis_client.setex(
-                    cache_key, settings.cache_ttl, json.dumps(cache_data)
+                # Shorter TTL so sites that add a LinkedIn link are re-scanned sooner
+                redis_client.set(
+                    cache_key,
+                    orjson.dumps(cache_data),
+                    ex=settings.empty_result_cache_ttl,
+                    nx=True,
                 )
-                print(f"[LinkedIn Cache] Saved empty result for {website}")
+                logger.debug("[LinkedIn Cache] Saved empty result for %s", website)
             except Exception as e:
-                print(f"[!] Error saving to LinkedIn cache: {e}")
+                logger.error("Error saving to LinkedIn cache: %s", e)
             return result
 
         # 5. Save to LinkedIn-only cache and return (no AI validation needed)
-        print(f"[LinkedIn Cache] Saving LinkedIn URLs to cache for {website}")
+        logger.debug("[LinkedIn Cache] Saving LinkedIn URLs to cache for %s", website)
         try:
             cache_data = {
                 "company_linkedin": company_urls,
                 "personal_linkedin": personal_urls,
             }
-            redis_client.setex(cache_key, settings.cache_ttl, json.dumps(cache_data))
-            print(f"[LinkedIn Cache] Saved to cache with TTL: {settings.cache_ttl}s")
+            redis_client.set(
+                cache_key, orjson.dumps(cache_data), ex=settings.cache_ttl, nx=True
+            )
+            logger.debug(
+                "[LinkedIn Cache] Saved to cache with TTL: %ss", settings.cache_ttl
+            )
         except Exception as e:
-            print(f"[!] Error saving to LinkedIn cache: {e}")
+            logger.error("Error saving to LinkedIn cache: %s", e)
 
         return LinkedInOnlyResponse(
             website=website,
@@ -119,7 +177,7 @@ def scrape_linkedin_only(
 
     except Exception as e:
         error_message = str(e)
-        print(f"[!] Error scraping LinkedIn from {website}: {error_message}")
+        logger.warning("Error scraping LinkedIn from %s: %s", website, error_message)
         return LinkedInErrorResponse(
             website=website, error=error_message, status="error"
         )
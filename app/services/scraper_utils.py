@@ -1,15 +1,71 @@
 """Web scraping utility functions."""
+import logging
 import re
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from html import unescape
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin, urlparse, urlsplit
 from typing import Optional
 
+logger = logging.getLogger(__name__)
 
+# Shared HTTP session so connections and TLS sessions are reused across fetches
+# (pool_connections = hosts kept alive, pool_maxsize = connections per host).
+# Nothing is retried: a slow or unreachable site would only repeat its timeout,
+# and urllib3 already replaces a pooled keep-alive connection the server has
+# closed before reusing it.
+_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=100, pool_maxsize=20, max_retries=0)
+_session.mount("http://", _http_adapter)
+_session.mount("https://", _http_adapter)
+# Sent with every fetch; Accept-Encoding keeps urllib3's default, which only
+# advertises the encodings it can decode here
+_session.headers["User-Agent"] = "Mozilla/5.0"
+
+# Largest page body read by fetch_page; contact details sit well within it
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Inline <script> and <style> blocks, dropped before the regex extractors run:
+# their code is not contact details and can be most of a page's markup.
+# JSON-LD blocks are kept since they carry the site's own email and sameAs links.
+_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style)\b(?![^>]*ld\+json)[^>]*>.*?</\1\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Email addresses. The lookbehind only lets a match start at the beginning of a
+# run of local-part characters, so long runs without an "@" are scanned once
+# instead of once per starting position (the matches found are unchanged).
+_EMAIL_RE = re.compile(
+    r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+)
+
+# Characters scanned on either side of each "@" by _emails_from_markup; an
+# address can be at most 254 characters long (RFC 5321)
+_EMAIL_WINDOW = 256
+
+# Phone numbers in visible text
+_PHONE_RE = re.compile(r"(\+?\d[\d\s().-]{6,}\d)")
+
+# Everything but digits, stripped to compare phone numbers formatted differently
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# LinkedIn company and personal profile URLs, matched in a single pass
+_LINKEDIN_URL_RE = re.compile(
+    r"https?://(?:www\.)?linkedin\.com/(company|in)/[a-zA-Z0-9_-]+"
+)
+
+
+@lru_cache(maxsize=100_000)
 def normalize_url(url: str) -> str:
     """
     Normalize a URL to a consistent format.
     
+    Results are memoized: CSV jobs normalize each row's website when grouping
+    rows and again when scraping it, and lead lists repeat sites often.
+    
     Args:
         url: Raw URL string
         
@@ -48,6 +104,9 @@ def fetch_page(url: str, timeout: int = 10) -> Optional[str]:
     """
     Fetch a webpage with timeout and error handling.
     
+    The body is streamed and only its first MAX_PAGE_BYTES are read, and
+    responses that are not text (PDFs, images, archives) are not downloaded.
+    
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds
@@ -56,21 +115,28 @@ def fetch_page(url: str, timeout: int = 10) -> Optional[str]:
         HTML content as string, or None if fetch failed
     """
     try:
-        res = requests.get(
-            url, 
-            timeout=timeout, 
-            headers={"User-Agent": "Mozilla/5.0"}
-        )
-        res.raise_for_status()
-        return res.text
+        with _session.get(url, timeout=timeout, stream=True) as res:
+            res.raise_for_status()
+            content_type = res.headers.get("Content-Type", "")
+            if content_type and not any(
+                t in content_type for t in ("html", "text", "xml")
+            ):
+                raise ValueError(f"Not an HTML page ({content_type})")
+
+            body = bytearray()
+            for chunk in res.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+            return str(body[:MAX_PAGE_BYTES], res.encoding or "utf-8", errors="replace")
     except Exception as e:
-        print(f"[!] Error fetching {url}: {e}")
+        logger.debug("Error fetching %s: %s", url, e)
         return None
 
 
 def extract_emails(html: str) -> list[str]:
     """
-    Extract email addresses from HTML text.
+    Extract email addresses from HTML text, skipping inline scripts and styles.
     
     Args:
         html: HTML content
@@ -78,8 +144,29 @@ def extract_emails(html: str) -> list[str]:
     Returns:
         List of unique email addresses
     """
-    pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    return list(set(re.findall(pattern, html)))
+    return _emails_from_markup(_strip_html_noise(html))
+
+
+def _emails_from_markup(markup: str) -> list[str]:
+    """Extract email addresses from markup already stripped of scripts."""
+    # Every address contains an "@", so only the text around each one is
+    # handed to the regex (nearby "@"s share a window) instead of the whole page
+    emails = set()
+    at = markup.find("@")
+    while at != -1:
+        start = max(at - _EMAIL_WINDOW, 0)
+        end = at + _EMAIL_WINDOW
+        at = markup.find("@", at + 1)
+        while at != -1 and at - _EMAIL_WINDOW <= end:
+            end = at + _EMAIL_WINDOW
+            at = markup.find("@", at + 1)
+        emails.update(_EMAIL_RE.findall(markup, start, end))
+    return list(emails)
+
+
+def _strip_html_noise(html: str) -> str:
+    """Remove inline script and style blocks (except JSON-LD) from HTML."""
+    return _SCRIPT_STYLE_RE.sub(" ", html)
 
 
 def extract_phones(html: str) -> list[str]:
@@ -92,9 +179,50 @@ def extract_phones(html: str) -> list[str]:
     Returns:
         List of unique phone numbers
     """
-    text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-    phone_regex = re.compile(r"(\+?\d[\d\s().-]{6,}\d)")
-    return list(set(phone_regex.findall(text)))
+    return _phones_from_dom(LexborHTMLParser(_strip_html_noise(html)))
+
+
+def _phones_from_dom(dom: LexborHTMLParser) -> list[str]:
+    """Extract phone numbers from a parsed page's visible text (strips its scripts)."""
+    # Scripts and styles are not visible text
+    dom.strip_tags(["script", "style", "template"])
+    text = dom.text(separator=" ", strip=True)
+    return list(set(_PHONE_RE.findall(text)))
+
+
+def dedupe_emails(emails: list[str]) -> list[str]:
+    """
+    Remove duplicate email addresses, ignoring case.
+    
+    Args:
+        emails: Email addresses, possibly repeated
+        
+    Returns:
+        Email addresses in their original order, first spelling of each kept
+    """
+    unique = {}
+    for email in emails:
+        unique.setdefault(email.lower(), email)
+    return list(unique.values())
+
+
+def dedupe_phones(phones: list[str]) -> list[str]:
+    """
+    Remove duplicate phone numbers, ignoring formatting.
+    
+    Numbers are compared by their digits only, so "+1 (555) 123-4567" and
+    "+1 555.123.4567" count as the same number.
+    
+    Args:
+        phones: Phone numbers, possibly repeated
+        
+    Returns:
+        Phone numbers in their original order, first formatting of each kept
+    """
+    unique = {}
+    for phone in phones:
+        unique.setdefault(_NON_DIGIT_RE.sub("", phone), phone)
+    return list(unique.values())
 
 
 def extract_links(html: str, base_url: str) -> list[str]:
@@ -108,16 +236,30 @@ def extract_links(html: str, base_url: str) -> list[str]:
     Returns:
         List of unique internal links
     """
-    soup = BeautifulSoup(html, "html.parser")
-    links = []
-    base_domain = base_url.split("//")[1].split("/")[0]
+    return _links_from_dom(LexborHTMLParser(html), base_url)
+
+
+def _links_from_dom(dom: LexborHTMLParser, base_url: str) -> list[str]:
+    """Extract internal links from a parsed page."""
+    # Links on the site itself or a subdomain, whichever scheme or "www." they use
+    site_host = (urlsplit(base_url).hostname or "").removeprefix("www.")
+    subdomain_suffix = "." + site_host
+    # Dict keys dedupe the links while keeping their order on the page
+    links = {}
     
-    for a in soup.find_all("a", href=True):
-        href = urljoin(base_url, a["href"])
-        if base_domain in href:
-            links.append(href)
+    for a in dom.css("a[href]"):
+        href = a.attributes["href"] or ""
+        parts = urlsplit(href)
+        if parts.scheme not in ("", "http", "https"):
+            continue  # mailto:, tel:, javascript: and the like
+        # Relative links are always internal; absolute ones must name the site
+        if parts.netloc:
+            host = parts.hostname or ""
+            if host != site_host and not host.endswith(subdomain_suffix):
+                continue
+        links[urljoin(base_url, href)] = None
             
-    return list(set(links))
+    return list(links)
 
 
 def extract_linkedin_urls(html: str) -> dict[str, list[str]]:
@@ -131,32 +273,22 @@ def extract_linkedin_urls(html: str) -> dict[str, list[str]]:
     Returns:
         Dictionary with 'company' and 'personal' keys containing lists of LinkedIn URLs
     """
+    return _linkedin_urls_from_markup(_strip_html_noise(html))
+
+
+def _linkedin_urls_from_markup(markup: str) -> dict[str, list[str]]:
+    """Extract LinkedIn URLs from markup already stripped of scripts."""
     company_urls = []
     personal_urls = []
     
-    # Regex patterns for LinkedIn URLs
-    company_pattern = r'https?://(?:www\.)?linkedin\.com/company/[a-zA-Z0-9_-]+'
-    personal_pattern = r'https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9_-]+'
-    
-    # Find all LinkedIn URLs in HTML (including href attributes and plain text)
-    soup = BeautifulSoup(html, "html.parser")
-    
-    # Extract from href attributes
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "linkedin.com/company/" in href:
-            match = re.search(company_pattern, href)
-            if match:
-                company_urls.append(match.group(0))
-        elif "linkedin.com/in/" in href:
-            match = re.search(personal_pattern, href)
-            if match:
-                personal_urls.append(match.group(0))
-    
-    # Extract from plain text
-    text_content = str(soup)
-    company_urls.extend(re.findall(company_pattern, text_content))
-    personal_urls.extend(re.findall(personal_pattern, text_content))
+    # Scan the markup once; href attributes are part of it, so a single regex
+    # pass finds both linked and plain-text LinkedIn URLs. Unescaping entities
+    # (e.g. "&#x2F;" in an href) is all a full parse would add here.
+    for match in _LINKEDIN_URL_RE.finditer(unescape(markup)):
+        if match.group(1) == "company":
+            company_urls.append(match.group(0))
+        else:
+            personal_urls.append(match.group(0))
     
     # Remove duplicates and normalize
     company_urls = list(set(url.rstrip('/') for url in company_urls))
@@ -166,3 +298,33 @@ def extract_linkedin_urls(html: str) -> dict[str, list[str]]:
         "company": company_urls,
         "personal": personal_urls
     }
+
+
+def extract_contacts(
+    html: str, base_url: Optional[str] = None
+) -> tuple[list[str], list[str], dict[str, list[str]], list[str]]:
+    """
+    Extract emails, phone numbers, LinkedIn URLs and internal links in one parse.
+    
+    Equivalent to calling extract_emails, extract_phones,
+    extract_linkedin_urls and extract_links, but the HTML is parsed only once.
+    
+    Args:
+        html: HTML content
+        base_url: Base URL for resolving relative links; internal links are
+            only collected when it is given
+        
+    Returns:
+        Tuple of (emails, phones, LinkedIn URLs dict with 'company' and
+        'personal', internal links)
+    """
+    markup = _strip_html_noise(html)
+    dom = LexborHTMLParser(markup)
+    # Links are read before _phones_from_dom strips tags from the tree
+    links = _links_from_dom(dom, base_url) if base_url else []
+    return (
+        _emails_from_markup(markup),
+        _phones_from_dom(dom),
+        _linkedin_urls_from_markup(markup),
+        links,
+    )
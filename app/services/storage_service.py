@@ -1,46 +1,66 @@
 """Supabase storage service for managing file uploads and downloads."""
-from supabase import create_client, Client
+import logging
 from app.core.config import get_settings
-from typing import Optional
+from app.core.database import supabase
+from typing import Optional, Union
 from pathlib import Path
 import io
+import threading
 
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Initialize Supabase client
-supabase: Client = create_client(settings.supabase_url, settings.supabase_key)
+# Storage calls go through the shared Supabase client from app.core.database, so
+# uploads and downloads reuse its keep-alive HTTP/2 connection pool
+_bucket = supabase.storage.from_(settings.supabase_bucket)
+
+# The bucket is checked (and created if missing) once per process rather than
+# on every upload; a failed check is retried on the next upload
+_bucket_ready = False
+_bucket_lock = threading.Lock()
 
 
 def ensure_bucket_exists() -> bool:
     """
     Ensure the Supabase storage bucket exists.
     
+    Only the first successful call per process hits the storage API.
+    
     Returns:
         True if bucket exists or was created, False otherwise
     """
-    try:
-        # Try to get bucket info
-        buckets = supabase.storage.list_buckets()
-        bucket_names = [bucket.name for bucket in buckets]
-        
-        if settings.supabase_bucket not in bucket_names:
-            # Create bucket if it doesn't exist
-            supabase.storage.create_bucket(
-                settings.supabase_bucket,
-                options={"public": False}
-            )
-            print(f"[Supabase] Created bucket: {settings.supabase_bucket}")
-        
+    global _bucket_ready
+    if _bucket_ready:
         return True
-    except Exception as e:
-        print(f"[!] Error ensuring bucket exists: {e}")
-        return False
+
+    with _bucket_lock:
+        if _bucket_ready:
+            return True
+
+        try:
+            # Try to get bucket info
+            buckets = supabase.storage.list_buckets()
+            bucket_names = [bucket.name for bucket in buckets]
+            
+            if settings.supabase_bucket not in bucket_names:
+                # Create bucket if it doesn't exist
+                supabase.storage.create_bucket(
+                    settings.supabase_bucket,
+                    options={"public": False}
+                )
+                logger.info("[Supabase] Created bucket: %s", settings.supabase_bucket)
+            
+            _bucket_ready = True
+            return True
+        except Exception as e:
+            logger.error("Error ensuring bucket exists: %s", e)
+            return False
 
 
 def upload_csv_to_storage(
     job_id: int,
-    csv_content: bytes,
+    csv_content: Union[bytes, Path],
     original_filename: str,
     is_output: bool = False
 ) -> Optional[str]:
@@ -49,7 +69,8 @@ def upload_csv_to_storage(
     
     Args:
         job_id: Unique job identifier (integer primary key)
-        csv_content: CSV file content as bytes
+        csv_content: CSV file content as bytes, or path to a local CSV file
+            which is streamed to storage without loading it into memory
         original_filename: Original filename of the CSV
         is_output: Whether this is an output file (processed)
         
@@ -65,17 +86,25 @@ def upload_csv_to_storage(
         storage_path = f"jobs/{job_id}/{folder}/{filename}"
         
         # Upload to Supabase storage
-        response = supabase.storage.from_(settings.supabase_bucket).upload(
-            path=storage_path,
-            file=csv_content,
-            file_options={"content-type": "text/csv", "upsert": "true"}
-        )
+        if isinstance(csv_content, Path):
+            with open(csv_content, "rb") as csv_file:
+                _bucket.upload(
+                    path=storage_path,
+                    file=csv_file,
+                    file_options={"content-type": "text/csv", "upsert": "true"}
+                )
+        else:
+            _bucket.upload(
+                path=storage_path,
+                file=csv_content,
+                file_options={"content-type": "text/csv", "upsert": "true"}
+            )
         
-        print(f"[Supabase] Uploaded file to: {storage_path}")
+        logger.info("[Supabase] Uploaded file to: %s", storage_path)
         return storage_path
         
     except Exception as e:
-        print(f"[!] Error uploading to Supabase storage: {e}")
+        logger.error("Error uploading to Supabase storage: %s", e)
         return None
 
 
@@ -90,12 +119,12 @@ def download_csv_from_storage(storage_path: str) -> Optional[bytes]:
         File content as bytes if successful, None otherwise
     """
     try:
-        response = supabase.storage.from_(settings.supabase_bucket).download(storage_path)
-        print(f"[Supabase] Downloaded file from: {storage_path}")
+        response = _bucket.download(storage_path)
+        logger.info("[Supabase] Downloaded file from: %s", storage_path)
         return response
         
     except Exception as e:
-        print(f"[!] Error downloading from Supabase storage: {e}")
+        logger.error("Error downloading from Supabase storage: %s", e)
         return None
 
 
@@ -111,7 +140,7 @@ def get_public_url(storage_path: str) -> Optional[str]:
     """
     try:
         # Create signed URL that expires in 1 hour (3600 seconds)
-        response = supabase.storage.from_(settings.supabase_bucket).create_signed_url(
+        response = _bucket.create_signed_url(
             storage_path,
             3600
         )
@@ -119,7 +148,7 @@ def get_public_url(storage_path: str) -> Optional[str]:
         return response.get("signedURL")
         
     except Exception as e:
-        print(f"[!] Error creating signed URL: {e}")
+        logger.error("Error creating signed URL: %s", e)
         return None
 
 
@@ -134,12 +163,12 @@ def delete_file(storage_path: str) -> bool:
         True if deleted successfully, False otherwise
     """
     try:
-        supabase.storage.from_(settings.supabase_bucket).remove([storage_path])
-        print(f"[Supabase] Deleted file: {storage_path}")
+        _bucket.remove([storage_path])
+        logger.info("[Supabase] Deleted file: %s", storage_path)
         return True
         
     except Exception as e:
-        print(f"[!] Error deleting from Supabase storage: {e}")
+        logger.error("Error deleting from Supabase storage: %s", e)
         return False
 
 
@@ -154,9 +183,9 @@ def list_job_files(job_id: int) -> list[str]:
         List of file paths
     """
     try:
-        response = supabase.storage.from_(settings.supabase_bucket).list(f"jobs/{job_id}")
+        response = _bucket.list(f"jobs/{job_id}")
         return [file.get("name") for file in response]
         
     except Exception as e:
-        print(f"[!] Error listing job files: {e}")
+        logger.error("Error listing job files: %s", e)
         return []
@@ -1,17 +1,23 @@
 """Worker service for managing job queue with concurrency control."""
-import threading
+import logging
 import queue
-from typing import Callable, Any
-from datetime import datetime
+import threading
+from typing import Callable, Optional
 from app.core.config import get_settings
+from app.core.database import update_job_status
 
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
 class WorkerPool:
     """
     A worker pool that processes jobs with a maximum concurrency limit.
+    
+    A fixed set of daemon worker threads take jobs off a queue, so a queued job
+    starts as soon as a worker frees up, and a server shutdown never waits for
+    long-running jobs (they are marked failed instead, see shutdown).
     """
     
     def __init__(self, max_workers: int = 2):
@@ -22,88 +28,85 @@ class WorkerPool:
             max_workers: Maximum number of concurrent jobs (default: 2)
         """
         self.max_workers = max_workers
-        self.job_queue = queue.Queue()
-        self.active_workers = 0
+        self.job_queue: queue.Queue[Optional[tuple]] = queue.Queue()
+        self.active_jobs: set[int] = set()
+        self.queued_jobs = 0
         self.lock = threading.Lock()
         self.running = True
         
-        # Start the dispatcher thread
-        self.dispatcher_thread = threading.Thread(
-            target=self._dispatcher,
-            daemon=True
-        )
-        self.dispatcher_thread.start()
+        for i in range(max_workers):
+            threading.Thread(
+                target=self._worker, name=f"csv-job_{i}", daemon=True
+            ).start()
         
-        print(f"[WorkerPool] Initialized with {max_workers} max concurrent workers")
+        logger.info(
+            "[WorkerPool] Initialized with %s max concurrent workers", max_workers
+        )
     
-    def _dispatcher(self):
-        """
-        Dispatcher thread that manages job assignment to workers.
-        """
-        while self.running:
-            try:
-                # Wait for a job to be available
-                job_data = self.job_queue.get(timeout=1)
-                
-                # Wait until a worker slot is available
-                while True:
-                    with self.lock:
-                        if self.active_workers < self.max_workers:
-                            self.active_workers += 1
-                            break
-                    threading.Event().wait(0.5)  # Sleep briefly
-                
-                # Start the job in a new thread
-                worker_thread = threading.Thread(
-                    target=self._execute_job,
-                    args=(job_data,),
-                    daemon=True
-                )
-                worker_thread.start()
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"[WorkerPool] Dispatcher error: {e}")
+    @property
+    def active_workers(self) -> int:
+        """Number of jobs currently running."""
+        return len(self.active_jobs)
+    
+    def _worker(self):
+        """Worker thread loop: run queued jobs until a stop sentinel arrives."""
+        while True:
+            job = self.job_queue.get()
+            if job is None:
+                return
+            self._execute_job(*job)
     
-    def _execute_job(self, job_data: dict):
+    def _execute_job(self, job_id: int, job_func: Callable, args: tuple, kwargs: dict):
         """
         Execute a single job.
         
         Args:
-            job_data: Dictionary containing job_func, args, and kwargs
+            job_id: ID of the job being run
+            job_func: The function to execute
+            args: Positional arguments for the function
+            kwargs: Keyword arguments for the function
         """
-        job_func = job_data["job_func"]
-        args = job_data.get("args", ())
-        kwargs = job_data.get("kwargs", {})
+        with self.lock:
+            self.queued_jobs -= 1
+            if not self.running:
+                return
+            self.active_jobs.add(job_id)
         
         try:
-            print(f"[WorkerPool] Starting job (active: {self.active_workers}/{self.max_workers})")
+            logger.info(
+                "[WorkerPool] Starting job %s (active: %s/%s)",
+                job_id,
+                self.active_workers,
+                self.max_workers,
+            )
             job_func(*args, **kwargs)
         except Exception as e:
-            print(f"[WorkerPool] Job execution error: {e}")
+            logger.error("[WorkerPool] Job execution error: %s", e)
         finally:
             with self.lock:
-                self.active_workers -= 1
-            print(f"[WorkerPool] Job completed (active: {self.active_workers}/{self.max_workers})")
+                self.active_jobs.discard(job_id)
+            logger.info(
+                "[WorkerPool] Job %s completed (active: %s/%s)",
+                job_id,
+                self.active_workers,
+                self.max_workers,
+            )
     
-    def submit_job(self, job_func: Callable, *args, **kwargs):
+    def submit_job(self, job_id: int, job_func: Callable, *args, **kwargs):
         """
         Submit a job to the queue.
         
         Args:
+            job_id: ID of the job, marked failed if the pool shuts down first
             job_func: The function to execute
             *args: Positional arguments for the function
             **kwargs: Keyword arguments for the function
         """
-        job_data = {
-            "job_func": job_func,
-            "args": args,
-            "kwargs": kwargs,
-            "submitted_at": datetime.now()
-        }
-        self.job_queue.put(job_data)
-        print(f"[WorkerPool] Job queued (queue size: {self.job_queue.qsize()})")
+        with self.lock:
+            self.queued_jobs += 1
+            queued_jobs = self.queued_jobs
+        self.job_queue.put((job_id, job_func, args, kwargs))
+        logger.info("[WorkerPool] Job queued (queue size: %s)", queued_jobs)
     
     def get_stats(self) -> dict:
         """
@@ -112,36 +115,73 @@ class WorkerPool:
         Returns:
             Dictionary with pool statistics
         """
-        return {
-            "max_workers": self.max_workers,
-            "active_workers": self.active_workers,
-            "queued_jobs": self.job_queue.qsize(),
-            "available_slots": self.max_workers - self.active_workers
-        }
+        with self.lock:
+            return {
+                "max_workers": self.max_workers,
+                "active_workers": self.active_workers,
+                "queued_jobs": self.queued_jobs,
+                "available_slots": self.max_workers - self.active_workers
+            }
     
     def shutdown(self):
         """
-        Shutdown the worker pool gracefully.
+        Shutdown the worker pool without waiting for running jobs.
+        
+        Queued jobs are dropped and, like the jobs still running, marked failed,
+        so none is left stuck in queued or processing. The daemon worker threads
+        end with the process.
         """
-        print("[WorkerPool] Shutting down...")
-        self.running = False
-        self.dispatcher_thread.join(timeout=5)
+        logger.info("[WorkerPool] Shutting down...")
+        with self.lock:
+            self.running = False
+            running = list(self.active_jobs)
+        
+        queued = []
+        while True:
+            try:
+                job = self.job_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                queued.append(job[0])
+        with self.lock:
+            self.queued_jobs -= len(queued)
+        
+        for job_id in queued:
+            update_job_status(
+                job_id, status="failed", error="Server shut down before the job started"
+            )
+        for job_id in running:
+            update_job_status(
+                job_id, status="failed", error="Server shut down while the job was running"
+            )
+        if queued or running:
+            logger.warning(
+                "[WorkerPool] Marked %s queued and %s running job(s) failed",
+                len(queued),
+                len(running),
+            )
+        
+        # Let idle workers exit
+        for _ in range(self.max_workers):
+            self.job_queue.put(None)
 
 
 # Global worker pool instance - uses max_workers from config
 worker_pool = WorkerPool(max_workers=settings.max_workers)
 
 
-def submit_csv_job(job_func: Callable, *args, **kwargs):
+def submit_csv_job(job_id: int, job_func: Callable, *args, **kwargs):
     """
     Submit a CSV processing job to the worker pool.
     
     Args:
+        job_id: ID of the job being submitted
         job_func: The processing function to execute
         *args: Positional arguments
         **kwargs: Keyword arguments
     """
-    worker_pool.submit_job(job_func, *args, **kwargs)
+    worker_pool.submit_job(job_id, job_func, *args, **kwargs)
 
 
 def get_worker_stats() -> dict:
@@ -152,3 +192,8 @@ def get_worker_stats() -> dict:
         Dictionary with statistics
     """
     return worker_pool.get_stats()
+
+
+def shutdown_worker_pool() -> None:
+    """Shut down the worker pool, marking unfinished jobs failed."""
+    worker_pool.shutdown()
@@ -1,18 +1,36 @@
 """Contact Scraper API - Main application entry point."""
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.api.router import api_router
-from app.core.config import get_settings
+from app.core.logger import setup_logging
+
+# Configure logging before the app modules log anything at import time
+setup_logging()
+
+from app.api.router import api_router  # noqa: E402
+from app.api.routes.csv import UploadSizeLimitMiddleware  # noqa: E402
+from app.core.config import get_settings  # noqa: E402
+from app.services.worker_service import shutdown_worker_pool  # noqa: E402
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Mark unfinished CSV jobs failed when the server stops (or reloads)."""
+    yield
+    shutdown_worker_pool()
+
+
 app = FastAPI(
     title=settings.app_name,
     description="API for scraping contact information from websites",
     version="1.0.0",
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 
@@ -35,6 +53,10 @@ class ResponseCleanupMiddleware(BaseHTTPMiddleware):
         return response
 
 
+# Cap CSV upload bodies before FastAPI reads them (innermost, so its 413
+# responses still get the CORS and cleanup headers)
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # Add response cleanup middleware first
 app.add_middleware(ResponseCleanupMiddleware)
 
@@ -18,13 +18,54 @@ CREATE TABLE IF NOT EXISTS scraping.contact_scraper_jobs (
     error TEXT,
     input_path TEXT,
     output_path TEXT,
-    original_filename TEXT
+    original_filename TEXT,
+    lock_version INTEGER NOT NULL DEFAULT 0
 );
 
+-- Optimistic locking: every status write bumps lock_version, and update_job_status
+-- only applies its change when lock_version still matches what it read. Progress
+-- counters are not guarded and leave lock_version alone.
+-- For tables created before this column existed:
+ALTER TABLE scraping.contact_scraper_jobs ADD COLUMN IF NOT EXISTS lock_version INTEGER NOT NULL DEFAULT 0;
+
 -- Index for faster job lookups
 CREATE INDEX IF NOT EXISTS idx_contact_scraper_jobs_status ON scraping.contact_scraper_jobs(status);
 CREATE INDEX IF NOT EXISTS idx_contact_scraper_jobs_created_at ON scraping.contact_scraper_jobs(created_at DESC);
 
+-- ============================================================================
+-- Atomic progress increments (called via supabase.rpc from database.py)
+-- ============================================================================
+-- Bumps the counters in a single UPDATE so concurrent workers never lose
+-- increments. Counters never complete a job: the worker marks it completed only
+-- once the output CSV is uploaded (update_job_status with output_path).
+-- Workers batch their progress and flush deltas through bulk_increment_job_progress.
+CREATE OR REPLACE FUNCTION scraping.bulk_increment_job_progress(
+    job_id BIGINT,
+    processed_delta INTEGER,
+    failed_delta INTEGER DEFAULT 0
+)
+RETURNS TABLE (processed_rows INTEGER, total_rows INTEGER, status TEXT)
+LANGUAGE sql
+AS $$
+    UPDATE scraping.contact_scraper_jobs AS j
+    SET processed_rows = j.processed_rows + processed_delta,
+        failed_rows = j.failed_rows + failed_delta
+    WHERE j.id = bulk_increment_job_progress.job_id
+    RETURNING j.processed_rows, j.total_rows, j.status;
+$$;
+
+-- The per-row increment_job_progress wrapper is no longer used:
+DROP FUNCTION IF EXISTS scraping.increment_job_progress(BIGINT, BOOLEAN);
+
+-- ============================================================================
+-- Auto-complete trigger (removed)
+-- ============================================================================
+-- Completing a job on processed_rows reaching total_rows flipped it to completed
+-- before its output was uploaded, and the two row counts need not agree anyway.
+-- Drop it from databases created with an earlier version of this script:
+DROP TRIGGER IF EXISTS auto_complete_job ON scraping.contact_scraper_jobs;
+DROP FUNCTION IF EXISTS scraping.auto_complete_job();
+
 -- ============================================================================
 -- Row Level Security (RLS) - Optional but recommended
 -- ============================================================================